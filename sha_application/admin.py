@@ -1,18 +1,93 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.utils.html import format_html
 from django.urls import reverse
 from django.utils.safestring import mark_safe
-from django.db.models import Count, Sum
+from django.db.models import Count, Sum, Exists, OuterRef, Q, Value, Prefetch
+from django.db.models.functions import Concat
 from django.utils import timezone
+from django.core.cache import cache
+from django.db import transaction
 from datetime import datetime, timedelta
 import json
 
+try:
+    import orjson
+except ImportError:  # optional; speeds up rendering of large report payloads
+    orjson = None
+
 from .models import (
     User, County, SubCounty, SHAMember, MemberDocument, Employer, EmployerMember,
     Hospital, HospitalStaff, Contribution, OTP, HospitalVisit, Medicine, PharmacyStock,
     Prescription, PrescriptionItem, Claim, Notification, AuditLog, GovernmentReport
 )
+from .caching import DASHBOARD_CACHE_VERSION, bump_cache_version
+from .paginators import KeysetPaginator, PkSlicePaginator
+from .stats import start_of_day
+
+# Fixed status badges; built once since they carry no per-row data
+_PAID = mark_safe('<span style="color: green;">✓ Paid</span>')
+_PENDING = mark_safe('<span style="color: red;">✗ Pending</span>')
+_LOW = mark_safe('<span style="color: red;">Low Stock</span>')
+_NORMAL = mark_safe('<span style="color: green;">Normal</span>')
+_EXP = mark_safe('<span style="color: red;">Expired</span>')
+_VALID = mark_safe('<span style="color: green;">Valid</span>')
+_YES = mark_safe('<span style="color: green;">✓</span>')
+_NO = mark_safe('<span style="color: red;">✗</span>')
+
+QR_TMPL = '<img src="{}" style="max-height: 100px; max-width: 100px;" />'
+QR_URL_TIMEOUT = 300  # keep below the expiry of signed storage URLs
+
+def _qr_code_img(name):
+    # storage.url() can mean a signature computation on remote backends, so
+    # the rendered tag is memoised per stored file name.
+    storage = SHAMember._meta.get_field('qr_code').storage
+    return cache.get_or_set(
+        f'qr_code_img:{name}',
+        lambda: format_html(QR_TMPL, storage.url(name)),
+        QR_URL_TIMEOUT
+    )
+
+def log_bulk_action(request, model_name, action_type, entries):
+    """
+    Write one AuditLog row per ``(object_id, description)`` in batched INSERTs.
+
+    Bulk actions change rows with ``update()``, which skips post_save, so the
+    dashboard cache is invalidated here once the transaction commits.
+    """
+    transaction.on_commit(lambda: bump_cache_version(DASHBOARD_CACHE_VERSION))
+    AuditLog.objects.bulk_create([
+        AuditLog(
+            user=request.user,
+            action_type=action_type,
+            model_name=model_name,
+            object_id=str(object_id),
+            description=description,
+            ip_address=request.META.get('REMOTE_ADDR'),
+            user_agent=request.META.get('HTTP_USER_AGENT', '')
+        )
+        for object_id, description in entries
+    ], batch_size=500)
+
+def lock_for_action(queryset, *fields):
+    """
+    Lock the action's rows (SELECT ... FOR UPDATE) and return their pk and
+    ``fields``. Call inside ``transaction.atomic()`` and update by the returned
+    pks so the audit entries describe exactly the rows that were changed.
+    """
+    return list(
+        queryset.model.objects.filter(pk__in=queryset.values('pk'))
+        .select_for_update()
+        .values_list('pk', *fields)
+    )
+
+REPORT_DATA_PREVIEW_LIMIT = 64 * 1024  # characters
+
+def _pretty_json(data):
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
 
 # ============================================================================
 # CUSTOM USER ADMIN
@@ -44,13 +119,18 @@ class CountyAdmin(admin.ModelAdmin):
     search_fields = ['name', 'code']
     ordering = ['name']
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(_subcounty_count=Count('subcounties'))
+    
     def subcounty_count(self, obj):
-        return obj.subcounties.count()
+        return obj._subcounty_count
     subcounty_count.short_description = 'Sub-Counties'
+    subcounty_count.admin_order_field = '_subcounty_count'
 
 @admin.register(SubCounty)
 class SubCountyAdmin(admin.ModelAdmin):
     list_display = ['name', 'county', 'code']
+    list_select_related = ['county']
     list_filter = ['county']
     search_fields = ['name', 'county__name']
     ordering = ['county__name', 'name']
@@ -64,13 +144,32 @@ class MemberDocumentInline(admin.TabularInline):
     extra = 0
     readonly_fields = ['uploaded_at', 'verified_by']
     fields = ['document_type', 'document_file', 'description', 'verified', 'verified_by', 'uploaded_at']
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('member', 'verified_by')
+
+class SHAMemberChangeList(ChangeList):
+    """
+    Changelist that loads only the columns the member list renders, leaving
+    out the biometric template and other wide fields. The change form goes
+    through ModelAdmin.get_object and still loads complete rows.
+    """
+    
+    def get_queryset(self, request, exclude_parameters=None):
+        return super().get_queryset(request, exclude_parameters).only(
+            'id', 'sha_number', 'first_name', 'last_name', 'id_number',
+            'status', 'county__name', 'registration_date'
+        )
 
 @admin.register(SHAMember)
 class SHAMemberAdmin(admin.ModelAdmin):
     list_display = [
         'sha_number', 'full_name', 'id_number', 'status', 
-        'county', 'registration_date', 'contribution_status'
+        'county', 'registration_date', 'contribution_status',
+        'docs_verified', 'employed', 'visited_this_month'
     ]
+    list_select_related = ['county']
+    paginator = PkSlicePaginator
     list_filter = [
         'status', 'county', 'gender', 'registration_date', 'approval_date'
     ]
@@ -109,54 +208,112 @@ class SHAMemberAdmin(admin.ModelAdmin):
     
     actions = ['approve_members', 'suspend_members', 'activate_members']
     
+    def get_changelist(self, request, **kwargs):
+        return SHAMemberChangeList
+    
     def full_name(self, obj):
-        return f"{obj.first_name} {obj.last_name}"
+        return obj._full_name
     full_name.short_description = 'Full Name'
+    full_name.admin_order_field = '_full_name'
+    
+    def get_queryset(self, request):
+        current_month = timezone.localdate().replace(day=1)
+        month_start = start_of_day(current_month)
+        return super().get_queryset(request).annotate(
+            _has_paid=Exists(Contribution.objects.filter(
+                member=OuterRef('pk'),
+                contribution_month=current_month,
+                status='completed'
+            )),
+            _docs_verified=Exists(MemberDocument.objects.filter(
+                member=OuterRef('pk'),
+                verified=True
+            )),
+            _employed=Exists(EmployerMember.objects.filter(
+                member=OuterRef('pk'),
+                is_active=True
+            )),
+            _visited_month=Exists(HospitalVisit.objects.filter(
+                member=OuterRef('pk'),
+                visit_date__gte=month_start
+            )),
+            _full_name=Concat('first_name', Value(' '), 'last_name')
+        )
     
     def qr_code_preview(self, obj):
-        if obj.qr_code:
-            return format_html(
-                '<img src="{}" style="max-height: 100px; max-width: 100px;" />',
-                obj.qr_code.url
-            )
+        if obj.qr_code and obj.qr_code.name:
+            return _qr_code_img(obj.qr_code.name)
         return "No QR Code"
     qr_code_preview.short_description = 'QR Code Preview'
     
     def contribution_status(self, obj):
-        current_month = timezone.now().date().replace(day=1)
-        has_contributed = obj.contributions.filter(
-            contribution_month=current_month,
-            status='completed'
-        ).exists()
-        
-        if has_contributed:
-            return format_html('<span style="color: green;">✓ Paid</span>')
-        else:
-            return format_html('<span style="color: red;">✗ Pending</span>')
+        return _PAID if obj._has_paid else _PENDING
     contribution_status.short_description = 'Current Month'
+    contribution_status.admin_order_field = '_has_paid'
+    
+    def docs_verified(self, obj):
+        return obj._docs_verified
+    docs_verified.short_description = 'Docs Verified'
+    docs_verified.boolean = True
+    docs_verified.admin_order_field = '_docs_verified'
+    
+    def employed(self, obj):
+        return obj._employed
+    employed.short_description = 'Employed'
+    employed.boolean = True
+    employed.admin_order_field = '_employed'
+    
+    def visited_this_month(self, obj):
+        return obj._visited_month
+    visited_this_month.short_description = 'Visited This Month'
+    visited_this_month.boolean = True
+    visited_this_month.admin_order_field = '_visited_month'
     
     def approve_members(self, request, queryset):
-        updated = queryset.filter(status='pending').update(
-            status='active',
-            approval_date=timezone.now(),
-            approved_by=request.user
-        )
+        with transaction.atomic():
+            members = lock_for_action(queryset.filter(status='pending'), 'sha_number')
+            updated = SHAMember.objects.filter(pk__in=[pk for pk, _ in members]).update(
+                status='active',
+                approval_date=timezone.now(),
+                approved_by=request.user
+            )
+            log_bulk_action(request, 'SHAMember', 'approval', [
+                (pk, f'Member {sha_number} approved by {request.user.username}')
+                for pk, sha_number in members
+            ])
         self.message_user(request, f'{updated} members approved successfully.')
     approve_members.short_description = 'Approve selected members'
     
     def suspend_members(self, request, queryset):
-        updated = queryset.update(status='suspended')
+        with transaction.atomic():
+            members = lock_for_action(queryset, 'sha_number')
+            updated = SHAMember.objects.filter(
+                pk__in=[pk for pk, _ in members]
+            ).update(status='suspended')
+            log_bulk_action(request, 'SHAMember', 'update', [
+                (pk, f'Member {sha_number} suspended by {request.user.username}')
+                for pk, sha_number in members
+            ])
         self.message_user(request, f'{updated} members suspended.')
     suspend_members.short_description = 'Suspend selected members'
     
     def activate_members(self, request, queryset):
-        updated = queryset.update(status='active')
+        with transaction.atomic():
+            members = lock_for_action(queryset, 'sha_number')
+            updated = SHAMember.objects.filter(
+                pk__in=[pk for pk, _ in members]
+            ).update(status='active')
+            log_bulk_action(request, 'SHAMember', 'update', [
+                (pk, f'Member {sha_number} activated by {request.user.username}')
+                for pk, sha_number in members
+            ])
         self.message_user(request, f'{updated} members activated.')
     activate_members.short_description = 'Activate selected members'
 
 @admin.register(MemberDocument)
 class MemberDocumentAdmin(admin.ModelAdmin):
     list_display = ['member', 'document_type', 'verified', 'uploaded_at', 'verified_by']
+    list_select_related = ['member', 'verified_by']
     list_filter = ['document_type', 'verified', 'uploaded_at']
     search_fields = ['member__sha_number', 'member__first_name', 'member__last_name']
     readonly_fields = ['uploaded_at']
@@ -164,7 +321,15 @@ class MemberDocumentAdmin(admin.ModelAdmin):
     actions = ['verify_documents']
     
     def verify_documents(self, request, queryset):
-        updated = queryset.update(verified=True, verified_by=request.user)
+        with transaction.atomic():
+            documents = [pk for pk, in lock_for_action(queryset)]
+            updated = MemberDocument.objects.filter(
+                pk__in=documents
+            ).update(verified=True, verified_by=request.user)
+            log_bulk_action(request, 'MemberDocument', 'approval', [
+                (pk, f'Document {pk} verified by {request.user.username}')
+                for pk in documents
+            ])
         self.message_user(request, f'{updated} documents verified.')
     verify_documents.short_description = 'Verify selected documents'
 
@@ -177,6 +342,9 @@ class EmployerMemberInline(admin.TabularInline):
     extra = 0
     readonly_fields = ['calculate_monthly_contribution']
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('employer', 'member')
+    
     def calculate_monthly_contribution(self, obj):
         if obj.pk:
             return f"KSh {obj.calculate_monthly_contribution():,.2f}"
@@ -186,7 +354,7 @@ class EmployerMemberInline(admin.TabularInline):
 class EmployerAdmin(admin.ModelAdmin):
     list_display = [
         'company_name', 'registration_number', 'contact_person_name',
-        'employee_count', 'status', 'registration_date'
+        'active_employee_count', 'status', 'registration_date'
     ]
     list_filter = ['status', 'industry', 'county', 'registration_date']
     search_fields = ['company_name', 'registration_number', 'tax_pin', 'email']
@@ -214,10 +382,6 @@ class EmployerAdmin(admin.ModelAdmin):
             'fields': ('status', 'registration_date', 'approved_by')
         })
     )
-    
-    def employee_count(self, obj):
-        return obj.employees.filter(is_active=True).count()
-    employee_count.short_description = 'Active Employees'
 
 @admin.register(EmployerMember)
 class EmployerMemberAdmin(admin.ModelAdmin):
@@ -225,19 +389,27 @@ class EmployerMemberAdmin(admin.ModelAdmin):
         'employer', 'member_name', 'employee_number', 'monthly_salary',
         'monthly_contribution', 'is_active'
     ]
+    list_select_related = ['employer', 'member']
     list_filter = ['is_active', 'employer', 'date_joined']
     search_fields = [
         'employer__company_name', 'member__sha_number',
         'member__first_name', 'member__last_name', 'employee_number'
     ]
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_monthly_contribution().annotate(
+            _full_name=Concat('member__first_name', Value(' '), 'member__last_name')
+        )
+    
     def member_name(self, obj):
-        return f"{obj.member.first_name} {obj.member.last_name}"
+        return obj._full_name
     member_name.short_description = 'Member Name'
+    member_name.admin_order_field = '_full_name'
     
     def monthly_contribution(self, obj):
-        return f"KSh {obj.calculate_monthly_contribution():,.2f}"
+        return f"KSh {obj.monthly_contribution:,.2f}"
     monthly_contribution.short_description = 'Monthly Contribution'
+    monthly_contribution.admin_order_field = 'monthly_contribution'
 
 # ============================================================================
 # HOSPITAL ADMIN
@@ -247,13 +419,17 @@ class HospitalStaffInline(admin.TabularInline):
     model = HospitalStaff
     extra = 0
     readonly_fields = ['date_joined']
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('user', 'hospital')
 
 @admin.register(Hospital)
 class HospitalAdmin(admin.ModelAdmin):
     list_display = [
         'name', 'hospital_type', 'level', 'county', 'status',
-        'active_staff_count', 'registration_date'
+        'active_staff_count', 'visit_count', 'registration_date'
     ]
+    paginator = PkSlicePaginator
     list_filter = ['hospital_type', 'level', 'status', 'county', 'registration_date']
     search_fields = ['name', 'registration_number', 'email', 'phone_number']
     readonly_fields = ['registration_date']
@@ -277,14 +453,11 @@ class HospitalAdmin(admin.ModelAdmin):
             'fields': ('status', 'registration_date', 'approved_by')
         })
     )
-    
-    def active_staff_count(self, obj):
-        return obj.staff.filter(is_active=True).count()
-    active_staff_count.short_description = 'Active Staff'
 
 @admin.register(HospitalStaff)
 class HospitalStaffAdmin(admin.ModelAdmin):
     list_display = ['user', 'hospital', 'role', 'staff_number', 'is_active']
+    list_select_related = ['user', 'hospital']
     list_filter = ['role', 'is_active', 'hospital', 'date_joined']
     search_fields = [
         'user__username', 'user__first_name', 'user__last_name',
@@ -301,6 +474,8 @@ class ContributionAdmin(admin.ModelAdmin):
         'member', 'contribution_month', 'amount', 'payment_method',
         'status', 'payment_date', 'employer'
     ]
+    list_select_related = ['member', 'employer']
+    show_full_result_count = False
     list_filter = [
         'contribution_type', 'payment_method', 'status', 
         'payment_date', 'contribution_month'
@@ -339,14 +514,25 @@ class ContributionAdmin(admin.ModelAdmin):
 class OTPAdmin(admin.ModelAdmin):
     list_display = [
         'member', 'purpose', 'otp_code', 'hospital', 
-        'is_used', 'created_at', 'expires_at'
+        'is_used', 'created_at', 'expires_at', 'expired'
     ]
+    list_select_related = ['member', 'hospital']
+    show_full_result_count = False
     list_filter = ['purpose', 'is_used', 'created_at', 'hospital']
     search_fields = [
         'member__sha_number', 'otp_code', 'phone_number', 'email'
     ]
     readonly_fields = ['created_at', 'used_at', 'otp_code']
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_expiry_flag()
+    
+    def expired(self, obj):
+        return obj._is_expired
+    expired.short_description = 'Expired'
+    expired.boolean = True
+    expired.admin_order_field = '_is_expired'
+    
     def get_readonly_fields(self, request, obj=None):
         if obj:  # editing an existing object
             return self.readonly_fields + ['otp_code']
@@ -362,6 +548,8 @@ class HospitalVisitAdmin(admin.ModelAdmin):
         'visit_number', 'member', 'hospital', 'visit_type',
         'status', 'visit_date', 'otp_verified'
     ]
+    list_select_related = ['member']
+    show_full_result_count = False
     list_filter = [
         'visit_type', 'status', 'otp_verified', 
         'visit_date', 'hospital'
@@ -373,6 +561,12 @@ class HospitalVisitAdmin(admin.ModelAdmin):
     readonly_fields = ['visit_number', 'created_at', 'otp_verified_at']
     date_hierarchy = 'visit_date'
     
+    def get_queryset(self, request):
+        # Hospitals repeat across visits, so load them once per page
+        return super().get_queryset(request).prefetch_related(
+            Prefetch('hospital', queryset=Hospital.objects.only('id', 'name'))
+        )
+    
     fieldsets = (
         ('Visit Information', {
             'fields': (
@@ -417,6 +611,8 @@ class PharmacyStockAdmin(admin.ModelAdmin):
         'hospital', 'medicine_name', 'current_stock', 'minimum_stock_level',
         'stock_status', 'expiry_date', 'expired_status'
     ]
+    list_select_related = ['hospital', 'medicine']
+    show_full_result_count = False
     list_filter = [
         'hospital', 'medicine__category', 'expiry_date',
         'last_restocked_date'
@@ -427,26 +623,37 @@ class PharmacyStockAdmin(admin.ModelAdmin):
     ]
     readonly_fields = ['created_at', 'updated_at']
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_stock_flags()
+    
     def medicine_name(self, obj):
         return obj.medicine.name
     medicine_name.short_description = 'Medicine'
     
     def stock_status(self, obj):
-        if obj.is_low_stock():
-            return format_html('<span style="color: red;">Low Stock</span>')
-        return format_html('<span style="color: green;">Normal</span>')
+        return _LOW if obj._is_low else _NORMAL
     stock_status.short_description = 'Stock Status'
+    stock_status.admin_order_field = '_is_low'
     
     def expired_status(self, obj):
-        if obj.is_expired():
-            return format_html('<span style="color: red;">Expired</span>')
-        return format_html('<span style="color: green;">Valid</span>')
+        return _EXP if obj._is_expired else _VALID
     expired_status.short_description = 'Expiry Status'
+    expired_status.admin_order_field = '_is_expired'
 
 class PrescriptionItemInline(admin.TabularInline):
     model = PrescriptionItem
     extra = 0
-    readonly_fields = ['is_fully_dispensed']
+    readonly_fields = ['fully_dispensed']
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related(
+            'prescription', 'medicine'
+        ).with_dispensed_flag()
+    
+    def fully_dispensed(self, obj):
+        return getattr(obj, '_is_fully_dispensed', False)
+    fully_dispensed.short_description = 'Fully dispensed'
+    fully_dispensed.boolean = True
 
 @admin.register(Prescription)
 class PrescriptionAdmin(admin.ModelAdmin):
@@ -465,9 +672,26 @@ class PrescriptionAdmin(admin.ModelAdmin):
     readonly_fields = ['prescription_number', 'prescribed_date', 'dispensed_date']
     inlines = [PrescriptionItemInline]
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related(
+            'visit__member', 'prescribed_by__user', 'prescribed_by__hospital'
+        ).annotate(
+            _full_name=Concat('visit__member__first_name', Value(' '), 'visit__member__last_name')
+        )
+    
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        if db_field.name == 'visit':
+            kwargs['queryset'] = HospitalVisit.objects.select_related('member', 'hospital')
+        elif db_field.name in ('prescribed_by', 'dispensed_by'):
+            kwargs['queryset'] = HospitalStaff.objects.select_related('user', 'hospital')
+        elif db_field.name == 'collection_otp':
+            kwargs['queryset'] = OTP.objects.select_related('member')
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+    
     def member_name(self, obj):
-        return f"{obj.visit.member.first_name} {obj.visit.member.last_name}"
+        return obj._full_name
     member_name.short_description = 'Member'
+    member_name.admin_order_field = '_full_name'
 
 # ============================================================================
 # CLAIMS ADMIN
@@ -479,6 +703,7 @@ class ClaimAdmin(admin.ModelAdmin):
         'claim_number', 'hospital', 'member_name', 'claim_type',
         'amount_claimed', 'amount_approved', 'status', 'submitted_date'
     ]
+    paginator = PkSlicePaginator
     list_filter = [
         'claim_type', 'status', 'submitted_date', 'reviewed_date', 'hospital'
     ]
@@ -510,26 +735,50 @@ class ClaimAdmin(admin.ModelAdmin):
         })
     )
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related(
+            'visit__member', 'hospital', 'reviewed_by'
+        ).annotate(
+            _full_name=Concat('visit__member__first_name', Value(' '), 'visit__member__last_name')
+        )
+    
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        if db_field.name == 'visit':
+            kwargs['queryset'] = HospitalVisit.objects.select_related('member', 'hospital')
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+    
     def member_name(self, obj):
-        member = obj.visit.member
-        return f"{member.first_name} {member.last_name}"
+        return obj._full_name
     member_name.short_description = 'Member'
+    member_name.admin_order_field = '_full_name'
     
     def approve_claims(self, request, queryset):
-        updated = queryset.filter(status='submitted').update(
-            status='approved',
-            reviewed_date=timezone.now(),
-            reviewed_by=request.user
-        )
+        with transaction.atomic():
+            claims = lock_for_action(queryset.filter(status='submitted'), 'claim_number')
+            updated = Claim.objects.filter(pk__in=[pk for pk, _ in claims]).update(
+                status='approved',
+                reviewed_date=timezone.now(),
+                reviewed_by=request.user
+            )
+            log_bulk_action(request, 'Claim', 'approval', [
+                (pk, f'Claim {claim_number} approved by {request.user.username}')
+                for pk, claim_number in claims
+            ])
         self.message_user(request, f'{updated} claims approved.')
     approve_claims.short_description = 'Approve selected claims'
     
     def reject_claims(self, request, queryset):
-        updated = queryset.filter(status='submitted').update(
-            status='rejected',
-            reviewed_date=timezone.now(),
-            reviewed_by=request.user
-        )
+        with transaction.atomic():
+            claims = lock_for_action(queryset.filter(status='submitted'), 'claim_number')
+            updated = Claim.objects.filter(pk__in=[pk for pk, _ in claims]).update(
+                status='rejected',
+                reviewed_date=timezone.now(),
+                reviewed_by=request.user
+            )
+            log_bulk_action(request, 'Claim', 'rejection', [
+                (pk, f'Claim {claim_number} rejected by {request.user.username}')
+                for pk, claim_number in claims
+            ])
         self.message_user(request, f'{updated} claims rejected.')
     reject_claims.short_description = 'Reject selected claims'
 
@@ -543,6 +792,8 @@ class NotificationAdmin(admin.ModelAdmin):
         'recipient_user', 'notification_type', 'method', 'title',
         'is_sent', 'sent_at', 'read_at'
     ]
+    list_select_related = ['recipient_user']
+    show_full_result_count = False
     list_filter = [
         'notification_type', 'method', 'is_sent', 'sent_at'
     ]
@@ -562,6 +813,7 @@ class AuditLogAdmin(admin.ModelAdmin):
         'user', 'action_type', 'model_name', 'object_id',
         'timestamp', 'ip_address'
     ]
+    list_select_related = ['user']
     list_filter = [
         'action_type', 'model_name', 'timestamp'
     ]
@@ -571,6 +823,8 @@ class AuditLogAdmin(admin.ModelAdmin):
     ]
     readonly_fields = ['timestamp']
     date_hierarchy = 'timestamp'
+    paginator = KeysetPaginator
+    show_full_result_count = False
     
     def has_add_permission(self, request):
         return False  # Audit logs should not be manually created
@@ -591,6 +845,7 @@ class GovernmentReportAdmin(admin.ModelAdmin):
         'report_type', 'report_period', 'generated_by',
         'generated_at', 'has_file'
     ]
+    list_select_related = ['generated_by']
     list_filter = [
         'report_type', 'generated_at', 'report_period_start'
     ]
@@ -619,16 +874,17 @@ class GovernmentReportAdmin(admin.ModelAdmin):
     report_period.short_description = 'Period'
     
     def has_file(self, obj):
-        if obj.report_file:
-            return format_html('<span style="color: green;">✓</span>')
-        return format_html('<span style="color: red;">✗</span>')
+        return _YES if obj.report_file else _NO
     has_file.short_description = 'File'
     
     def report_data_display(self, obj):
         if obj.report_data:
+            text = _pretty_json(obj.report_data)
+            if len(text) > REPORT_DATA_PREVIEW_LIMIT:
+                text = text[:REPORT_DATA_PREVIEW_LIMIT] + '\n… (truncated)'
             return format_html(
                 '<pre style="max-height: 300px; overflow: auto;">{}</pre>',
-                json.dumps(obj.report_data, indent=2)
+                text
             )
         return "No data"
     report_data_display.short_description = 'Report Data'
@@ -645,33 +901,49 @@ admin.site.index_title = "Welcome to SHA Digital Platform"
 class AdminDashboard:
     """Custom dashboard with key statistics"""
     
+    CACHE_TIMEOUT = 60  # seconds
+    
     @staticmethod
     def get_member_stats():
-        from django.db.models import Count
-        return {
-            'total_members': SHAMember.objects.count(),
-            'active_members': SHAMember.objects.filter(status='active').count(),
-            'pending_approvals': SHAMember.objects.filter(status='pending').count(),
-        }
+        def compute():
+            stats = SHAMember.objects.aggregate(
+                total=Count('id'),
+                active=Count('id', filter=Q(status='active')),
+                pending=Count('id', filter=Q(status='pending')),
+            )
+            return {
+                'total_members': stats['total'],
+                'active_members': stats['active'],
+                'pending_approvals': stats['pending'],
+            }
+        return cache.get_or_set('admin_dashboard:member_stats', compute, AdminDashboard.CACHE_TIMEOUT)
     
     @staticmethod
     def get_contribution_stats():
-        current_month = timezone.now().date().replace(day=1)
-        return {
-            'monthly_contributions': Contribution.objects.filter(
-                contribution_month=current_month,
-                status='completed'
-            ).aggregate(total=Sum('amount'))['total'] or 0,
-            'pending_contributions': Contribution.objects.filter(
-                status='pending'
-            ).count(),
-        }
+        def compute():
+            current_month = timezone.localdate().replace(day=1)
+            stats = Contribution.objects.aggregate(
+                monthly=Sum('amount', filter=Q(
+                    contribution_month=current_month,
+                    status='completed'
+                )),
+                pending=Count('id', filter=Q(status='pending')),
+            )
+            return {
+                'monthly_contributions': stats['monthly'] or 0,
+                'pending_contributions': stats['pending'],
+            }
+        return cache.get_or_set('admin_dashboard:contribution_stats', compute, AdminDashboard.CACHE_TIMEOUT)
     
     @staticmethod
     def get_claim_stats():
-        return {
-            'pending_claims': Claim.objects.filter(status='submitted').count(),
-            'approved_claims_value': Claim.objects.filter(
-                status='approved'
-            ).aggregate(total=Sum('amount_approved'))['total'] or 0,
-        }
+        def compute():
+            stats = Claim.objects.aggregate(
+                pending=Count('id', filter=Q(status='submitted')),
+                approved_value=Sum('amount_approved', filter=Q(status='approved')),
+            )
+            return {
+                'pending_claims': stats['pending'],
+                'approved_claims_value': stats['approved_value'] or 0,
+            }
+        return cache.get_or_set('admin_dashboard:claim_stats', compute, AdminDashboard.CACHE_TIMEOUT)
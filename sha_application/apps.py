@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class ShaApplicationConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'sha_application'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,152 @@
+import atexit
+import logging
+import queue
+import threading
+
+from django.conf import settings
+from django.db import DatabaseError, DataError, IntegrityError, close_old_connections, transaction
+from django.utils import timezone
+
+from .models import AuditLog
+
+logger = logging.getLogger(__name__)
+
+AUDIT_LOG_BATCH_SIZE = getattr(settings, 'AUDIT_LOG_BATCH_SIZE', 1000)
+AUDIT_LOG_FLUSH_INTERVAL = getattr(settings, 'AUDIT_LOG_FLUSH_INTERVAL', 5)
+AUDIT_LOG_MAX_RETRY_DELAY = getattr(settings, 'AUDIT_LOG_MAX_RETRY_DELAY', 300)
+AUDIT_LOG_MAX_RETRIES = getattr(settings, 'AUDIT_LOG_MAX_RETRIES', 10)
+AUDIT_LOG_MAX_QUEUE_SIZE = getattr(settings, 'AUDIT_LOG_MAX_QUEUE_SIZE', 100000)
+
+
+class AuditLogBuffer:
+    """
+    In-process queue of unsaved ``AuditLog`` rows.
+
+    A daemon thread drains the queue every ``flush_interval`` seconds, or as
+    soon as ``batch_size`` entries are waiting, and writes them with one
+    ``bulk_create`` per batch. Anything still queued is flushed at interpreter
+    exit. Entries are held in memory only, so a hard crash loses at most one
+    interval's worth of events.
+
+    If a batch insert fails, its rows are inserted one at a time: rows the
+    database rejects (integrity or data errors) are logged and dropped, so a
+    single bad row cannot block the trail. Rows that fail for other reasons
+    (e.g. a lost connection) are kept and written first on the next flush,
+    up to ``max_retries`` times, while the retry delay doubles up to
+    ``max_retry_delay``. At most ``max_queue_size`` entries are held; further
+    entries are logged and dropped.
+    """
+
+    def __init__(self, batch_size=AUDIT_LOG_BATCH_SIZE, flush_interval=AUDIT_LOG_FLUSH_INTERVAL,
+                 max_retry_delay=AUDIT_LOG_MAX_RETRY_DELAY, max_retries=AUDIT_LOG_MAX_RETRIES,
+                 max_queue_size=AUDIT_LOG_MAX_QUEUE_SIZE):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_retry_delay = max_retry_delay
+        self.max_retries = max_retries
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._failed_batch = []
+        self._failed_attempts = 0
+        self._wakeup = threading.Event()
+        self._flush_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._worker = None
+
+    def put(self, entry):
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            logger.error('Audit log queue is full; dropping entry: %s', entry.description)
+        self._ensure_worker()
+        if self._queue.qsize() >= self.batch_size:
+            self._wakeup.set()
+
+    def flush(self):
+        with self._flush_lock:
+            while True:
+                batch, self._failed_batch = self._failed_batch, []
+                while len(batch) < self.batch_size:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                if not batch:
+                    return
+                try:
+                    with transaction.atomic():
+                        AuditLog.objects.bulk_create(batch, batch_size=self.batch_size)
+                except DatabaseError:
+                    self._clear_pks(batch)
+                    self._write_rows(batch)
+                self._failed_attempts = 0
+
+    def _write_rows(self, batch):
+        for index, entry in enumerate(batch):
+            try:
+                with transaction.atomic():
+                    entry.save(force_insert=True)
+            except (IntegrityError, DataError):
+                entry.pk = None
+                logger.exception('Dropping audit log entry the database rejected: %s', entry.description)
+            except DatabaseError:
+                self._retry_later(batch[index:])
+                raise
+
+    def _retry_later(self, rows):
+        self._clear_pks(rows)
+        self._failed_attempts += 1
+        if self._failed_attempts > self.max_retries:
+            logger.error('Dropping %d audit log entries after %d failed attempts',
+                         len(rows), self._failed_attempts - 1)
+            self._failed_attempts = 0
+            return
+        self._failed_batch = rows
+
+    @staticmethod
+    def _clear_pks(rows):
+        # Rolled back; drop any pks assigned before the failure
+        for entry in rows:
+            entry.pk = None
+
+    def _ensure_worker(self):
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._start_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run, name='audit-log-writer', daemon=True
+                )
+                self._worker.start()
+
+    def _run(self):
+        delay = self.flush_interval
+        while True:
+            self._wakeup.wait(delay)
+            self._wakeup.clear()
+            try:
+                self.flush()
+                delay = self.flush_interval
+            except Exception:
+                delay = min(delay * 2, self.max_retry_delay)
+                logger.exception(
+                    'Failed to write buffered audit log entries; retrying in %s seconds', delay
+                )
+            finally:
+                close_old_connections()
+
+
+audit_buffer = AuditLogBuffer()
+atexit.register(audit_buffer.flush)
+
+
+def queue_audit_log(**fields):
+    """
+    Queue an ``AuditLog`` row for the background writer.
+
+    The entry is stamped now, not when the writer gets to it, and is only
+    handed to the buffer once the current transaction commits (immediately
+    under autocommit), so rolled-back work never leaves an audit trail behind.
+    """
+    fields.setdefault('timestamp', timezone.now())
+    entry = AuditLog(**fields)
+    transaction.on_commit(lambda: audit_buffer.put(entry))
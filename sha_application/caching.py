@@ -0,0 +1,89 @@
+import logging
+import threading
+import time
+
+from django.core.cache import cache
+from django.db import close_old_connections
+
+from .models import AuditLog, County
+
+logger = logging.getLogger(__name__)
+
+# Version key shared by every cached dashboard figure; bumped from signals.py
+DASHBOARD_CACHE_VERSION = 'dashboard:version'
+
+# Reference data, cleared from signals.py when a County changes
+COUNTIES_CACHE_KEY = 'reference:counties'
+
+# New audited model names are rare, so the filter list is only refreshed on expiry
+AUDIT_MODEL_NAMES_CACHE_KEY = 'reference:audit_model_names'
+AUDIT_MODEL_NAMES_TIMEOUT = 10 * 60
+
+
+def get_cache_version(version_key):
+    """Return the current version stamp for ``version_key``, creating it if missing."""
+    return cache.get_or_set(version_key, time.time_ns, timeout=None)
+
+
+def bump_cache_version(version_key):
+    """
+    Move ``version_key`` to a new stamp so keys built from the old one are
+    never read again (they simply expire).
+
+    A timestamp is used instead of ``cache.incr`` so that an evicted version
+    key can never be recreated at a value that was already handed out.
+    """
+    cache.set(version_key, time.time_ns(), timeout=None)
+
+
+def store_fresh(key, value, timeout):
+    """Store ``value`` for ``get_stale_while_revalidate`` as freshly computed."""
+    cache.set(key, (value, time.time()), timeout)
+
+
+def _refresh(key, compute, timeout):
+    try:
+        store_fresh(key, compute(), timeout)
+    except Exception:
+        logger.exception('Background refresh of %s failed', key)
+    finally:
+        cache.delete(f'{key}:refreshing')
+        close_old_connections()
+
+
+def get_stale_while_revalidate(key, compute, fresh_for, timeout):
+    """
+    Return the cached value for ``key``, computing it on a miss.
+
+    Entries older than ``fresh_for`` seconds are still served, while a single
+    background thread (guarded by a cache lock) recomputes them. ``timeout``
+    bounds how long a stale value may be served at all.
+    """
+    cached = cache.get(key)
+    if cached is None:
+        value = compute()
+        store_fresh(key, value, timeout)
+        return value
+
+    value, generated_at = cached
+    if time.time() - generated_at > fresh_for and cache.add(f'{key}:refreshing', True, fresh_for):
+        threading.Thread(target=_refresh, args=(key, compute, timeout), daemon=True).start()
+    return value
+
+
+def get_counties():
+    """All counties ordered by name, cached until a county is saved or deleted."""
+    return cache.get_or_set(
+        COUNTIES_CACHE_KEY, lambda: list(County.objects.order_by('name')), timeout=None
+    )
+
+
+def get_audit_model_names():
+    """Distinct ``AuditLog.model_name`` values for the audit log filter, cached briefly."""
+    return cache.get_or_set(
+        AUDIT_MODEL_NAMES_CACHE_KEY,
+        lambda: list(
+            AuditLog.objects.order_by('model_name').values_list('model_name', flat=True).distinct()
+        ),
+        timeout=AUDIT_MODEL_NAMES_TIMEOUT
+    )
@@ -0,0 +1,97 @@
+from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from sha_application.caching import DASHBOARD_CACHE_VERSION, bump_cache_version
+from sha_application.models import ACTIVE_CONTRIBUTION_STATUSES, Contribution, EmployerMember
+
+
+class Command(BaseCommand):
+    help = 'Post pending payroll contributions for every active employee for a month'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'month', nargs='?',
+            help='Contribution month as YYYY-MM (defaults to the current month)'
+        )
+        parser.add_argument('--chunk-size', type=int, default=5000)
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        if options['month']:
+            try:
+                month = datetime.strptime(options['month'], '%Y-%m').date()
+            except ValueError:
+                raise CommandError('Month must be given as YYYY-MM.')
+        else:
+            month = timezone.localdate().replace(day=1)
+
+        now = timezone.now()
+        # Skipped in the query rather than left to uniq_active_contrib, which
+        # backends without partial indexes (MySQL) do not create.
+        already_posted = Contribution.objects.filter(
+            member=OuterRef('member_id'),
+            contribution_month=month,
+            status__in=ACTIVE_CONTRIBUTION_STATUSES,
+        )
+        employees = (
+            EmployerMember.objects
+            .filter(is_active=True, employer__status='active')
+            .exclude(Exists(already_posted))
+            .with_monthly_contribution()
+            .order_by('member_id', 'employer_id')
+            .values_list('member_id', 'employer_id', 'monthly_contribution')
+        )
+
+        before = Contribution.objects.filter(contribution_month=month).count()
+        batch = []
+        queued = combined = 0
+        rows = employees.iterator(chunk_size=options['chunk_size'])
+        for member_id, jobs in groupby(rows, key=itemgetter(0)):
+            # uniq_active_contrib allows one row per member and month, so a
+            # member with several active employers gets one row for the sum,
+            # credited to the lowest employer id.
+            jobs = list(jobs)
+            employer_id = jobs[0][1]
+            combined += len(jobs) - 1
+            batch.append(Contribution(
+                member_id=member_id,
+                employer_id=employer_id,
+                contribution_type='employer',
+                amount=sum(amount for _, _, amount in jobs),
+                contribution_month=month,
+                payment_date=now,
+                payment_method='payroll',
+                payment_reference=f"PAYROLL-{employer_id}-{month:%Y%m}",
+            ))
+            queued += 1
+            if len(batch) >= options['chunk_size']:
+                self._insert(batch, options['batch_size'])
+                batch = []
+        if batch:
+            self._insert(batch, options['batch_size'])
+
+        # bulk_create skips post_save, so invalidate the dashboard cache here
+        bump_cache_version(DASHBOARD_CACHE_VERSION)
+
+        created = Contribution.objects.filter(contribution_month=month).count() - before
+        self.stdout.write(self.style.SUCCESS(
+            f"Posted {created} contributions for {month:%B %Y}."
+        ))
+        if combined:
+            self.stdout.write(
+                f"Summed {combined} additional employer contributions into their members' rows."
+            )
+        if queued > created:
+            self.stdout.write(self.style.WARNING(
+                f"Skipped {queued - created} members already posted by a concurrent run."
+            ))
+
+    def _insert(self, batch, batch_size):
+        # Guards against a concurrent run on backends that enforce
+        # uniq_active_contrib; conflicting rows are skipped, not fatal.
+        Contribution.objects.bulk_create(batch, batch_size=batch_size, ignore_conflicts=True)
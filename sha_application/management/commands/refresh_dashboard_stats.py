@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from sha_application.caching import store_fresh
+from sha_application.stats import (
+    DASHBOARD_STATS_TIMEOUT, dashboard_stats_key, dashboard_stats_payload
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Recompute the dashboard stats API payload and store it in the cache. '
+        'Schedule every minute (e.g. cron) when a shared cache backend is configured.'
+    )
+
+    def handle(self, *args, **options):
+        today = timezone.localdate()
+        key = dashboard_stats_key(today)
+        store_fresh(key, dashboard_stats_payload(today), DASHBOARD_STATS_TIMEOUT)
+        self.stdout.write(self.style.SUCCESS(f"Refreshed {key}."))
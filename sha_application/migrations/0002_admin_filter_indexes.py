@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sha_application', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['-timestamp'], name='auditlog_timestamp_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contribution',
+            index=models.Index(fields=['contribution_month', 'status'], name='contrib_month_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='shamember',
+            index=models.Index(fields=['status', 'registration_date'], name='member_status_reg_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='shamember',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['registration_date'], name='pending_members_idx'),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:43
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_active_counts(apps, schema_editor):
+    Employer = apps.get_model('sha_application', 'Employer')
+    EmployerMember = apps.get_model('sha_application', 'EmployerMember')
+    Hospital = apps.get_model('sha_application', 'Hospital')
+    HospitalStaff = apps.get_model('sha_application', 'HospitalStaff')
+
+    def active_count(model, fk_name):
+        return Coalesce(Subquery(
+            model.objects.filter(**{fk_name: OuterRef('pk')}, is_active=True)
+            .order_by()
+            .values(fk_name)
+            .annotate(total=Count('pk'))
+            .values('total')
+        ), 0)
+
+    Employer.objects.update(active_employee_count=active_count(EmployerMember, 'employer'))
+    Hospital.objects.update(active_staff_count=active_count(HospitalStaff, 'hospital'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sha_application', '0002_admin_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='employer',
+            name='active_employee_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Active Employees'),
+        ),
+        migrations.AddField(
+            model_name='hospital',
+            name='active_staff_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Active Staff'),
+        ),
+        migrations.RunPython(backfill_active_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sha_application', '0003_denormalize_active_counts'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='auditlog',
+            name='auditlog_timestamp_idx',
+        ),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['-timestamp', 'user'], name='auditlog_ts_user_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='claim',
+            index=models.Index(fields=['status', 'submitted_date'], name='claim_status_submitted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='employer',
+            index=models.Index(fields=['status', 'registration_date'], name='employer_status_reg_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='hospital',
+            index=models.Index(fields=['status', 'registration_date'], name='hospital_status_reg_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='hospitalvisit',
+            index=models.Index(fields=['visit_date', 'hospital'], name='visit_date_hospital_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='otp',
+            index=models.Index(condition=models.Q(('is_used', False)), fields=['expires_at'], name='otp_active_idx'),
+        ),
+    ]
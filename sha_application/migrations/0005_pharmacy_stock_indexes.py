@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sha_application', '0004_hot_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='pharmacystock',
+            index=models.Index(fields=['hospital', 'expiry_date'], name='stock_hospital_expiry_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pharmacystock',
+            index=models.Index(fields=['hospital', 'current_stock'], name='stock_hospital_level_idx'),
+        ),
+    ]
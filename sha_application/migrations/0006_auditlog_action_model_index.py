@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sha_application', '0005_pharmacy_stock_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['action_type', 'model_name', '-timestamp'], name='auditlog_action_model_ts_idx'),
+        ),
+    ]
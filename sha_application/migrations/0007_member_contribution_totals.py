@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:49
+
+from decimal import Decimal
+from django.db import migrations, models
+from django.db.models import Max, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def backfill_contribution_totals(apps, schema_editor):
+    Contribution = apps.get_model('sha_application', 'Contribution')
+    SHAMember = apps.get_model('sha_application', 'SHAMember')
+
+    completed = Contribution.objects.filter(
+        member=OuterRef('pk'), status='completed'
+    ).order_by().values('member')
+    SHAMember.objects.update(
+        total_contributed=Coalesce(
+            Subquery(completed.annotate(total=Sum('amount')).values('total')),
+            Decimal('0.00'),
+            output_field=models.DecimalField(max_digits=12, decimal_places=2)
+        ),
+        last_contribution_month=Subquery(
+            completed.annotate(latest=Max('contribution_month')).values('latest')
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sha_application', '0006_auditlog_action_model_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='shamember',
+            name='last_contribution_month',
+            field=models.DateField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='shamember',
+            name='total_contributed',
+            field=models.DecimalField(decimal_places=2, default=Decimal('0.00'), editable=False, max_digits=12),
+        ),
+        migrations.RunPython(backfill_contribution_totals, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sha_application', '0007_member_contribution_totals'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='contribution',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='contribution',
+            constraint=models.UniqueConstraint(condition=models.Q(('status__in', ['pending', 'completed'])), fields=('member', 'contribution_month'), name='uniq_active_contrib'),
+        ),
+    ]
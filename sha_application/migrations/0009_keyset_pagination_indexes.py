@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sha_application', '0008_contribution_partial_unique'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='claim',
+            index=models.Index(fields=['submitted_date', 'id'], name='claim_submitted_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='hospital',
+            index=models.Index(fields=['name', 'id'], name='hospital_name_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='shamember',
+            index=models.Index(fields=['registration_date', 'id'], name='member_reg_id_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sha_application', '0009_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contribution',
+            index=models.Index(fields=['status', 'payment_date'], name='contrib_status_paid_idx'),
+        ),
+    ]
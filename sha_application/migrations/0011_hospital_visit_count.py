@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:02
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_visit_counts(apps, schema_editor):
+    Hospital = apps.get_model('sha_application', 'Hospital')
+    HospitalVisit = apps.get_model('sha_application', 'HospitalVisit')
+
+    Hospital.objects.update(visit_count=Coalesce(Subquery(
+        HospitalVisit.objects.filter(hospital=OuterRef('pk'))
+        .order_by()
+        .values('hospital')
+        .annotate(total=Count('pk'))
+        .values('total')
+    ), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sha_application', '0010_contribution_status_payment_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='hospital',
+            name='visit_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Visits'),
+        ),
+        migrations.AddIndex(
+            model_name='hospital',
+            index=models.Index(fields=['-visit_count'], name='hospital_visit_count_idx'),
+        ),
+        migrations.RunPython(backfill_visit_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sha_application', '0011_hospital_visit_count'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['action_type', '-timestamp'], name='auditlog_action_ts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['user', '-timestamp'], name='auditlog_user_ts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='claim',
+            index=models.Index(fields=['hospital', '-submitted_date'], name='claim_hospital_submitted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='hospital',
+            index=models.Index(fields=['status', 'hospital_type', 'county'], name='hospital_status_type_cty_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='hospitalvisit',
+            index=models.Index(fields=['hospital', '-visit_date'], name='visit_hospital_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='shamember',
+            index=models.Index(fields=['county', 'status'], name='member_county_status_idx'),
+        ),
+    ]
@@ -1,12 +1,47 @@
 from django.contrib.auth.models import AbstractUser
-from django.db import models
+from django.db import models, transaction, IntegrityError
 from django.core.validators import RegexValidator, MinValueValidator
+from django.db.models.functions import Now
 from django.utils import timezone
 import uuid
 import secrets
-import string
 from decimal import Decimal
 
+
+def random_digits(length):
+    """Zero-padded string of ``length`` random digits from a single CSPRNG draw."""
+    return f"{secrets.randbelow(10 ** length):0{length}d}"
+
+
+class UniqueNumberMixin:
+    """
+    Assigns ``number_field`` from ``generate_<number_field>()`` on first save.
+
+    The unique index on the column detects collisions; the save is retried
+    with a fresh number instead of checking for an existing one before every
+    insert.
+    """
+    number_field = None
+    NUMBER_ATTEMPTS = 5
+    
+    def save(self, *args, **kwargs):
+        if getattr(self, self.number_field):
+            return super().save(*args, **kwargs)
+        
+        generate = getattr(self, f'generate_{self.number_field}')
+        for attempt in range(self.NUMBER_ATTEMPTS):
+            number = generate()
+            setattr(self, self.number_field, number)
+            try:
+                with transaction.atomic():
+                    return super().save(*args, **kwargs)
+            except IntegrityError:
+                collided = type(self)._default_manager.filter(**{self.number_field: number}).exists()
+                if not collided or attempt == self.NUMBER_ATTEMPTS - 1:
+                    setattr(self, self.number_field, '')
+                    raise
+
+
 # ============================================================================
 # CUSTOM USER MODEL
 # ============================================================================
@@ -55,7 +90,7 @@ class SubCounty(models.Model):
 # MEMBER MODELS
 # ============================================================================
 
-class SHAMember(models.Model):
+class SHAMember(UniqueNumberMixin, models.Model):
     GENDER_CHOICES = [
         ('M', 'Male'),
         ('F', 'Female'),
@@ -102,15 +137,32 @@ class SHAMember(models.Model):
     # QR Code for ID card
     qr_code = models.ImageField(upload_to='qr_codes/', null=True, blank=True)
     
-    def save(self, *args, **kwargs):
-        if not self.sha_number:
-            self.sha_number = self.generate_sha_number()
-        super().save(*args, **kwargs)
+    # Maintained from completed Contribution saves/deletes (see signals.py)
+    total_contributed = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        default=Decimal('0.00'),
+        editable=False
+    )
+    last_contribution_month = models.DateField(null=True, blank=True, editable=False)
+    
+    number_field = 'sha_number'
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'registration_date'], name='member_status_reg_idx'),
+            models.Index(fields=['registration_date', 'id'], name='member_reg_id_idx'),
+            models.Index(fields=['county', 'status'], name='member_county_status_idx'),
+            models.Index(
+                fields=['registration_date'],
+                condition=models.Q(status='pending'),
+                name='pending_members_idx'
+            ),
+        ]
     
     def generate_sha_number(self):
         # Generate SHA number: SHA + County Code + Random 6 digits
-        random_digits = ''.join(secrets.choice(string.digits) for _ in range(6))
-        return f"SHA{self.county.code}{random_digits}"
+        return f"SHA{self.county.code}{random_digits(6)}"
     
     def __str__(self):
         return f"{self.sha_number} - {self.first_name} {self.last_name}"
@@ -184,10 +236,32 @@ class Employer(models.Model):
         related_name='employers_approved'  # 👈 avoids clash
     )
     
+    # Maintained from EmployerMember saves/deletes (see signals.py)
+    active_employee_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Active Employees'
+    )
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'registration_date'], name='employer_status_reg_idx'),
+        ]
+    
     def __str__(self):
         return self.company_name
 
 
+class EmployerMemberQuerySet(models.QuerySet):
+    def with_monthly_contribution(self):
+        """Annotate ``monthly_contribution`` (salary x rate / 100) computed in SQL."""
+        return self.annotate(
+            monthly_contribution=models.ExpressionWrapper(
+                models.F('monthly_salary') * models.F('contribution_rate') / models.Value(Decimal('100')),
+                output_field=models.DecimalField(max_digits=12, decimal_places=2)
+            )
+        )
+
 class EmployerMember(models.Model):
     employer = models.ForeignKey(Employer, on_delete=models.CASCADE, related_name='employees')
     member = models.ForeignKey(SHAMember, on_delete=models.CASCADE, related_name='employers')
@@ -199,6 +273,8 @@ class EmployerMember(models.Model):
     date_joined = models.DateField()
     is_active = models.BooleanField(default=True)
     
+    objects = EmployerMemberQuerySet.as_manager()
+    
     class Meta:
         unique_together = ['employer', 'member']
     
@@ -248,6 +324,29 @@ class Hospital(models.Model):
     registration_date = models.DateTimeField(auto_now_add=True)
     approved_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True)
     
+    # Maintained from HospitalStaff saves/deletes (see signals.py)
+    active_staff_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Active Staff'
+    )
+    # Maintained from HospitalVisit saves/deletes (see signals.py)
+    visit_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Visits'
+    )
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'registration_date'], name='hospital_status_reg_idx'),
+            models.Index(fields=['name', 'id'], name='hospital_name_id_idx'),
+            models.Index(fields=['-visit_count'], name='hospital_visit_count_idx'),
+            models.Index(
+                fields=['status', 'hospital_type', 'county'], name='hospital_status_type_cty_idx'
+            ),
+        ]
+    
     def __str__(self):
         return self.name
 
@@ -276,6 +375,9 @@ class HospitalStaff(models.Model):
 # CONTRIBUTION MODELS
 # ============================================================================
 
+# Statuses that hold a member's one contribution slot for a month
+ACTIVE_CONTRIBUTION_STATUSES = ['pending', 'completed']
+
 class Contribution(models.Model):
     CONTRIBUTION_TYPES = [
         ('individual', 'Individual'),
@@ -289,7 +391,6 @@ class Contribution(models.Model):
         ('failed', 'Failed'),
         ('refunded', 'Refunded'),
     ]
-    
     PAYMENT_METHODS = [
         ('mpesa', 'M-Pesa'),
         ('bank', 'Bank Transfer'),
@@ -316,7 +417,19 @@ class Contribution(models.Model):
     processed_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True)
     
     class Meta:
-        unique_together = ['member', 'contribution_month']  # One contribution per member per month
+        indexes = [
+            models.Index(fields=['contribution_month', 'status'], name='contrib_month_status_idx'),
+            models.Index(fields=['status', 'payment_date'], name='contrib_status_paid_idx'),
+        ]
+        constraints = [
+            # One live contribution per member per month; failed and refunded
+            # attempts stay out of the index so a payment can be retried.
+            models.UniqueConstraint(
+                fields=['member', 'contribution_month'],
+                condition=models.Q(status__in=ACTIVE_CONTRIBUTION_STATUSES),
+                name='uniq_active_contrib'
+            ),
+        ]
     
     def __str__(self):
         return f"{self.member.sha_number} - {self.contribution_month.strftime('%B %Y')} - KSh {self.amount}"
@@ -325,6 +438,16 @@ class Contribution(models.Model):
 # OTP AND SECURITY MODELS
 # ============================================================================
 
+class OTPQuerySet(models.QuerySet):
+    def with_expiry_flag(self):
+        """Annotate ``_is_expired``, the SQL counterpart of ``OTP.is_expired()``."""
+        return self.annotate(
+            _is_expired=models.ExpressionWrapper(
+                models.Q(expires_at__lte=Now()),
+                output_field=models.BooleanField()
+            )
+        )
+
 class OTP(models.Model):
     OTP_PURPOSES = [
         ('hospital_visit', 'Hospital Visit Verification'),
@@ -345,6 +468,17 @@ class OTP(models.Model):
     expires_at = models.DateTimeField()
     used_at = models.DateTimeField(null=True, blank=True)
     
+    objects = OTPQuerySet.as_manager()
+    
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['expires_at'],
+                condition=models.Q(is_used=False),
+                name='otp_active_idx'
+            ),
+        ]
+    
     def save(self, *args, **kwargs):
         if not self.otp_code:
             self.otp_code = self.generate_otp()
@@ -353,7 +487,7 @@ class OTP(models.Model):
         super().save(*args, **kwargs)
     
     def generate_otp(self):
-        return ''.join(secrets.choice(string.digits) for _ in range(6))
+        return random_digits(6)
     
     def is_expired(self):
         return timezone.now() > self.expires_at
@@ -365,7 +499,7 @@ class OTP(models.Model):
 # HOSPITAL VISIT AND TREATMENT MODELS
 # ============================================================================
 
-class HospitalVisit(models.Model):
+class HospitalVisit(UniqueNumberMixin, models.Model):
     VISIT_STATUS = [
         ('scheduled', 'Scheduled'),
         ('checked_in', 'Checked In'),
@@ -408,15 +542,17 @@ class HospitalVisit(models.Model):
     
     created_at = models.DateTimeField(auto_now_add=True)
     
-    def save(self, *args, **kwargs):
-        if not self.visit_number:
-            self.visit_number = self.generate_visit_number()
-        super().save(*args, **kwargs)
+    number_field = 'visit_number'
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['visit_date', 'hospital'], name='visit_date_hospital_idx'),
+            models.Index(fields=['hospital', '-visit_date'], name='visit_hospital_date_idx'),
+        ]
     
     def generate_visit_number(self):
         today = timezone.now().strftime('%Y%m%d')
-        random_digits = ''.join(secrets.choice(string.digits) for _ in range(4))
-        return f"VIS{today}{random_digits}"
+        return f"VIS{today}{random_digits(6)}"
     
     def __str__(self):
         return f"{self.visit_number} - {self.member.sha_number} at {self.hospital.name}"
@@ -456,6 +592,37 @@ class Medicine(models.Model):
     def __str__(self):
         return f"{self.name} - {self.dosage_form}"
 
+class PharmacyStockQuerySet(models.QuerySet):
+    def low_stock(self, hospital=None):
+        qs = self.filter(current_stock__lte=models.F('minimum_stock_level'))
+        return qs.filter(hospital=hospital) if hospital is not None else qs
+    
+    def expired(self, hospital=None):
+        qs = self.filter(expiry_date__lt=timezone.localdate())
+        return qs.filter(hospital=hospital) if hospital is not None else qs
+    
+    def with_stock_flags(self):
+        """Annotate ``_is_low`` and ``_is_expired`` to match the model predicates."""
+        return self.annotate(
+            _is_low=models.ExpressionWrapper(
+                models.Q(current_stock__lte=models.F('minimum_stock_level')),
+                output_field=models.BooleanField()
+            ),
+            _is_expired=models.ExpressionWrapper(
+                models.Q(expiry_date__lt=timezone.localdate()),
+                output_field=models.BooleanField()
+            ),
+        )
+    
+    def alert_counts(self):
+        """Count low-stock and expired rows in a single aggregate query."""
+        return self.aggregate(
+            low_stock=models.Count(
+                'id', filter=models.Q(current_stock__lte=models.F('minimum_stock_level'))
+            ),
+            expired=models.Count('id', filter=models.Q(expiry_date__lt=timezone.localdate())),
+        )
+
 class PharmacyStock(models.Model):
     hospital = models.ForeignKey(Hospital, on_delete=models.CASCADE, related_name='pharmacy_stock')
     medicine = models.ForeignKey(Medicine, on_delete=models.CASCADE)
@@ -471,19 +638,25 @@ class PharmacyStock(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = PharmacyStockQuerySet.as_manager()
+    
     class Meta:
         unique_together = ['hospital', 'medicine', 'batch_number']
+        indexes = [
+            models.Index(fields=['hospital', 'expiry_date'], name='stock_hospital_expiry_idx'),
+            models.Index(fields=['hospital', 'current_stock'], name='stock_hospital_level_idx'),
+        ]
     
     def is_low_stock(self):
         return self.current_stock <= self.minimum_stock_level
     
     def is_expired(self):
-        return timezone.now().date() > self.expiry_date
+        return timezone.localdate() > self.expiry_date
     
     def __str__(self):
         return f"{self.hospital.name} - {self.medicine.name} - Stock: {self.current_stock}"
 
-class Prescription(models.Model):
+class Prescription(UniqueNumberMixin, models.Model):
     PRESCRIPTION_STATUS = [
         ('pending', 'Pending'),
         ('dispensed', 'Dispensed'),
@@ -506,19 +679,25 @@ class Prescription(models.Model):
     
     notes = models.TextField(blank=True)
     
-    def save(self, *args, **kwargs):
-        if not self.prescription_number:
-            self.prescription_number = self.generate_prescription_number()
-        super().save(*args, **kwargs)
+    number_field = 'prescription_number'
     
     def generate_prescription_number(self):
         today = timezone.now().strftime('%Y%m%d')
-        random_digits = ''.join(secrets.choice(string.digits) for _ in range(4))
-        return f"RX{today}{random_digits}"
+        return f"RX{today}{random_digits(6)}"
     
     def __str__(self):
         return f"{self.prescription_number} - {self.visit.member.sha_number}"
 
+class PrescriptionItemQuerySet(models.QuerySet):
+    def with_dispensed_flag(self):
+        """Annotate ``_is_fully_dispensed``, the SQL counterpart of ``is_fully_dispensed()``."""
+        return self.annotate(
+            _is_fully_dispensed=models.ExpressionWrapper(
+                models.Q(quantity_dispensed__gte=models.F('quantity_prescribed')),
+                output_field=models.BooleanField()
+            )
+        )
+
 class PrescriptionItem(models.Model):
     prescription = models.ForeignKey(Prescription, on_delete=models.CASCADE, related_name='items')
     medicine = models.ForeignKey(Medicine, on_delete=models.CASCADE)
@@ -528,6 +707,8 @@ class PrescriptionItem(models.Model):
     dosage_instructions = models.TextField()  # e.g., "Take 2 tablets twice daily after meals"
     duration_days = models.IntegerField()  # Number of days to take the medicine
     
+    objects = PrescriptionItemQuerySet.as_manager()
+    
     def is_fully_dispensed(self):
         return self.quantity_dispensed >= self.quantity_prescribed
     
@@ -538,7 +719,7 @@ class PrescriptionItem(models.Model):
 # CLAIMS AND REIMBURSEMENT MODELS
 # ============================================================================
 
-class Claim(models.Model):
+class Claim(UniqueNumberMixin, models.Model):
     CLAIM_TYPES = [
         ('consultation', 'Consultation'),
         ('treatment', 'Treatment'),
@@ -574,15 +755,18 @@ class Claim(models.Model):
     rejection_reason = models.TextField(blank=True)
     review_notes = models.TextField(blank=True)
     
-    def save(self, *args, **kwargs):
-        if not self.claim_number:
-            self.claim_number = self.generate_claim_number()
-        super().save(*args, **kwargs)
+    number_field = 'claim_number'
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'submitted_date'], name='claim_status_submitted_idx'),
+            models.Index(fields=['submitted_date', 'id'], name='claim_submitted_id_idx'),
+            models.Index(fields=['hospital', '-submitted_date'], name='claim_hospital_submitted_idx'),
+        ]
     
     def generate_claim_number(self):
         today = timezone.now().strftime('%Y%m%d')
-        random_digits = ''.join(secrets.choice(string.digits) for _ in range(4))
-        return f"CLM{today}{random_digits}"
+        return f"CLM{today}{random_digits(6)}"
     
     def __str__(self):
         return f"{self.claim_number} - {self.hospital.name} - KSh {self.amount_claimed}"
@@ -649,10 +833,16 @@ class AuditLog(models.Model):
     ip_address = models.GenericIPAddressField(null=True, blank=True)
     user_agent = models.TextField(blank=True)
     
-    timestamp = models.DateTimeField(auto_now_add=True)
+    timestamp = models.DateTimeField(default=timezone.now, editable=False)
     
     class Meta:
         ordering = ['-timestamp']
+        indexes = [
+            models.Index(fields=['-timestamp', 'user'], name='auditlog_ts_user_idx'),
+            models.Index(fields=['action_type', 'model_name', '-timestamp'], name='auditlog_action_model_ts_idx'),
+            models.Index(fields=['action_type', '-timestamp'], name='auditlog_action_ts_idx'),
+            models.Index(fields=['user', '-timestamp'], name='auditlog_user_ts_idx'),
+        ]
     
     def __str__(self):
         return f"{self.user} - {self.action_type} - {self.model_name} - {self.timestamp}"
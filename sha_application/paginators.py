@@ -0,0 +1,238 @@
+import base64
+import datetime
+import json
+from collections.abc import Sequence
+
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count, Q, Window
+
+
+class KeysetPaginator(Paginator):
+    """
+    Paginator that seeks to a page by its first key instead of reading the
+    whole page at an OFFSET.
+
+    Only the narrow ``(key_field, pk)`` projection is walked to find where
+    the requested page starts; the page rows are then fetched with a range
+    predicate that the ``key_field`` index can answer. Querysets that are not
+    ordered by ``-key_field, -pk`` (e.g. a column sort chosen in the admin)
+    fall back to plain OFFSET slicing.
+    """
+    key_field = 'timestamp'
+
+    def _is_keyset_ordered(self):
+        query = getattr(self.object_list, 'query', None)
+        if query is None:
+            return False
+        return tuple(query.order_by) in (
+            (f'-{self.key_field}', '-pk'),
+            (f'-{self.key_field}', '-id'),
+        )
+
+    def page(self, number):
+        if not self._is_keyset_ordered():
+            return super().page(number)
+
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+
+        start = list(self.object_list.values_list(self.key_field, 'pk')[bottom:bottom + 1])
+        if not start:
+            return self._get_page([], number, self)
+
+        key, pk = start[0]
+        rows = self.object_list.filter(
+            Q(**{f'{self.key_field}__lt': key}) |
+            Q(**{self.key_field: key, 'pk__lte': pk})
+        )[:top - bottom]
+        return self._get_page(rows, number, self)
+
+
+class PkSlicePaginator(Paginator):
+    """
+    Paginator that applies OFFSET/LIMIT to a primary-key-only query and then
+    fetches the page with ``pk IN (...)``.
+
+    The rows skipped by the OFFSET are read from an index instead of being
+    materialized with every joined column, while the outer queryset keeps its
+    select_related/annotations for the rows actually shown. The page pks are
+    read in their own query because MySQL rejects LIMIT inside an ``IN``
+    subquery.
+    """
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+
+        page_pks = list(self.object_list.values_list('pk', flat=True)[bottom:top])
+        rows = self.object_list.filter(pk__in=page_pks)
+        return self._get_page(rows, number, self)
+
+class CursorJSONEncoder(DjangoJSONEncoder):
+    """
+    DjangoJSONEncoder that keeps full microsecond precision on datetimes.
+
+    The stock encoder truncates to milliseconds, which would make a seek
+    predicate land before the boundary row and repeat it on the next page.
+    """
+
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+class CursorPage(Sequence):
+    """
+    One page of a ``CursorPaginator``.
+
+    Mirrors the parts of ``django.core.paginator.Page`` that list templates
+    use, with ``next_cursor``/``previous_cursor`` in place of page numbers.
+    """
+
+    def __init__(self, object_list, next_cursor=None, previous_cursor=None, count=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+        # Total matching rows, or None when the paginator was not asked to count
+        self.count = count
+
+    def __repr__(self):
+        return f'<CursorPage of {len(self.object_list)} objects>'
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class CursorPaginator:
+    """
+    Keyset paginator for the list views, addressed by an opaque cursor.
+
+    ``ordering`` must end in a unique column (normally the pk) so it defines
+    a total order. Each page seeks past the boundary row with
+    ``WHERE (a, pk) < (?, ?)``-style predicates and reads ``per_page + 1``
+    rows, so neither an OFFSET scan nor a COUNT(*) is needed. Malformed
+    cursors fall back to the first page, like ``Paginator.get_page``.
+
+    With ``with_count=True`` the first page also selects
+    ``COUNT(*) OVER ()``, so the total arrives with the page rows instead of
+    needing a separate query. The total is carried in the cursors of later
+    pages and exposed as ``CursorPage.count``. Given a ``count_cache_key``,
+    the first-page total is also cached for ``count_cache_timeout`` seconds,
+    and while it is cached the window count is skipped altogether.
+    """
+
+    def __init__(self, object_list, ordering, per_page, with_count=False,
+                 count_cache_key=None, count_cache_timeout=60):
+        self.object_list = object_list
+        self.ordering = tuple(ordering)
+        self.per_page = per_page
+        self.with_count = with_count
+        self.count_cache_key = count_cache_key
+        self.count_cache_timeout = count_cache_timeout
+        self.fields = [name.lstrip('-') for name in self.ordering]
+
+    def page(self, cursor=None):
+        direction, values, count = self.decode_cursor(cursor)
+        backwards = direction == 'previous'
+
+        ordering = [self._flip(name) for name in self.ordering] if backwards else self.ordering
+        queryset = self.object_list.order_by(*ordering)
+        count_first_page = False
+        if values is not None:
+            queryset = queryset.filter(self._seek(ordering, values))
+        elif self.with_count:
+            if self.count_cache_key is not None:
+                count = cache.get(self.count_cache_key)
+            if count is None:
+                queryset = queryset.annotate(_total_count=Window(Count('pk')))
+                count_first_page = True
+
+        rows = list(queryset[:self.per_page + 1])
+        if count_first_page:
+            count = rows[0]._total_count if rows else 0
+            if self.count_cache_key is not None:
+                cache.set(self.count_cache_key, count, self.count_cache_timeout)
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        if backwards:
+            rows.reverse()
+        if not rows:
+            return CursorPage(rows, count=count)
+
+        if backwards:
+            next_cursor = self.encode_cursor('next', rows[-1], count)
+            previous_cursor = self.encode_cursor('previous', rows[0], count) if has_more else None
+        else:
+            next_cursor = self.encode_cursor('next', rows[-1], count) if has_more else None
+            previous_cursor = (
+                self.encode_cursor('previous', rows[0], count) if values is not None else None
+            )
+        return CursorPage(rows, next_cursor, previous_cursor, count)
+
+    def encode_cursor(self, direction, row, count=None):
+        payload = {
+            'd': direction,
+            'v': [getattr(row, 'pk' if name == 'pk' else name) for name in self.fields],
+        }
+        if count is not None:
+            payload['t'] = count
+        raw = json.dumps(payload, cls=CursorJSONEncoder, separators=(',', ':'))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, cursor):
+        if not cursor:
+            return 'next', None, None
+        try:
+            raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            payload = json.loads(raw)
+            direction, values, count = payload['d'], payload['v'], payload.get('t')
+            if direction not in ('next', 'previous') or len(values) != len(self.fields):
+                raise ValueError
+            if count is not None:
+                count = int(count)
+            opts = self.object_list.model._meta
+            values = [
+                (opts.pk if name == 'pk' else opts.get_field(name)).to_python(value)
+                for name, value in zip(self.fields, values)
+            ]
+        except (ValueError, TypeError, KeyError, ValidationError):
+            return 'next', None, None
+        return direction, values, count
+
+    @staticmethod
+    def _flip(name):
+        return name[1:] if name.startswith('-') else f'-{name}'
+
+    def _seek(self, ordering, values):
+        # (a, b, c) after (x, y, z) in lexicographic order:
+        # a > x OR (a = x AND b > y) OR (a = x AND b = y AND c > z)
+        condition = Q()
+        equal = {}
+        for name, value in zip(ordering, values):
+            field = name.lstrip('-')
+            lookup = 'lt' if name.startswith('-') else 'gt'
+            condition |= Q(**equal, **{f'{field}__{lookup}': value})
+            equal[field] = value
+        return condition
@@ -0,0 +1,137 @@
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.db.models import Count, DecimalField, F, Max, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_init, pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from .caching import COUNTIES_CACHE_KEY, DASHBOARD_CACHE_VERSION, bump_cache_version
+from .models import (
+    Claim, Contribution, County, Employer, EmployerMember, Hospital, HospitalStaff,
+    HospitalVisit, PharmacyStock, SHAMember
+)
+
+# ============================================================================
+# DENORMALIZED COUNTERS
+# ============================================================================
+# Counters and totals are recomputed with a single UPDATE ... SET col =
+# (SELECT COUNT/SUM ...) rather than incremented, so saves that toggle
+# is_active or status, edits and deletes all converge on the right value.
+# Queryset.update() bypasses these signals.
+
+def _related_count(model, fk_name, **filters):
+    return Coalesce(Subquery(
+        model.objects.filter(**{fk_name: OuterRef('pk')}, **filters)
+        .order_by()
+        .values(fk_name)
+        .annotate(total=Count('pk'))
+        .values('total')
+    ), 0)
+
+def refresh_active_employee_count(*employer_ids):
+    Employer.objects.filter(pk__in=employer_ids).update(
+        active_employee_count=_related_count(EmployerMember, 'employer', is_active=True)
+    )
+
+def refresh_active_staff_count(*hospital_ids):
+    Hospital.objects.filter(pk__in=hospital_ids).update(
+        active_staff_count=_related_count(HospitalStaff, 'hospital', is_active=True)
+    )
+
+def adjust_visit_count(hospital_id, delta):
+    Hospital.objects.filter(pk=hospital_id).update(visit_count=F('visit_count') + delta)
+
+def refresh_member_contribution_totals(*member_ids):
+    completed = Contribution.objects.filter(
+        member=OuterRef('pk'), status='completed'
+    ).order_by().values('member')
+    SHAMember.objects.filter(pk__in=member_ids).update(
+        total_contributed=Coalesce(
+            Subquery(completed.annotate(total=Sum('amount')).values('total')),
+            Decimal('0.00'),
+            output_field=DecimalField(max_digits=12, decimal_places=2)
+        ),
+        last_contribution_month=Subquery(
+            completed.annotate(latest=Max('contribution_month')).values('latest')
+        ),
+    )
+
+PARENT_FIELDS = {
+    EmployerMember: 'employer_id',
+    HospitalStaff: 'hospital_id',
+    Contribution: 'member_id',
+}
+
+@receiver(pre_save, sender=EmployerMember)
+@receiver(pre_save, sender=HospitalStaff)
+@receiver(pre_save, sender=Contribution)
+def remember_parent(sender, instance, **kwargs):
+    # Remember the parent the row belonged to so a reassignment also
+    # refreshes the counter it was moved away from.
+    fk_name = PARENT_FIELDS[sender]
+    instance._previous_parent_id = (
+        sender.objects.filter(pk=instance.pk).values_list(fk_name, flat=True).first()
+        if instance.pk else None
+    )
+
+@receiver(post_save, sender=EmployerMember)
+@receiver(post_delete, sender=EmployerMember)
+def update_employer_counts(sender, instance, **kwargs):
+    previous = getattr(instance, '_previous_parent_id', None)
+    refresh_active_employee_count(*{instance.employer_id, previous} - {None})
+
+@receiver(post_save, sender=HospitalStaff)
+@receiver(post_delete, sender=HospitalStaff)
+def update_hospital_counts(sender, instance, **kwargs):
+    previous = getattr(instance, '_previous_parent_id', None)
+    refresh_active_staff_count(*{instance.hospital_id, previous} - {None})
+
+# Visits are saved on every check-in/out, so visit_count is incremented
+# rather than recounted, and only touched when a visit is created, deleted or
+# moved. The hospital a visit was loaded with is remembered at init, which
+# avoids a pre_save lookup.
+
+@receiver(post_init, sender=HospitalVisit)
+def remember_visit_hospital(sender, instance, **kwargs):
+    # Read from __dict__ so a deferred hospital_id is not fetched
+    instance._loaded_hospital_id = instance.__dict__.get('hospital_id')
+
+@receiver(post_save, sender=HospitalVisit)
+def count_saved_visit(sender, instance, created, **kwargs):
+    previous = instance._loaded_hospital_id
+    if created:
+        adjust_visit_count(instance.hospital_id, 1)
+    elif previous is not None and previous != instance.hospital_id:
+        adjust_visit_count(previous, -1)
+        adjust_visit_count(instance.hospital_id, 1)
+    instance._loaded_hospital_id = instance.hospital_id
+
+@receiver(post_delete, sender=HospitalVisit)
+def count_deleted_visit(sender, instance, **kwargs):
+    adjust_visit_count(instance.hospital_id, -1)
+
+@receiver(post_save, sender=Contribution)
+@receiver(post_delete, sender=Contribution)
+def update_member_contribution_totals(sender, instance, **kwargs):
+    previous = getattr(instance, '_previous_parent_id', None)
+    refresh_member_contribution_totals(*{instance.member_id, previous} - {None})
+
+# ============================================================================
+# CACHE INVALIDATION
+# ============================================================================
+
+DASHBOARD_MODELS = [
+    SHAMember, Employer, Hospital, Contribution, HospitalVisit, Claim, PharmacyStock,
+]
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_dashboard_cache(sender, **kwargs):
+    if sender in DASHBOARD_MODELS:
+        bump_cache_version(DASHBOARD_CACHE_VERSION)
+
+@receiver(post_save, sender=County)
+@receiver(post_delete, sender=County)
+def invalidate_county_cache(sender, **kwargs):
+    cache.delete(COUNTIES_CACHE_KEY)
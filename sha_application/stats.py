@@ -0,0 +1,48 @@
+import json
+from datetime import datetime, time, timedelta
+
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from .caching import DASHBOARD_CACHE_VERSION, get_cache_version
+from .models import SHAMember, Hospital, Claim, HospitalVisit, PharmacyStock
+
+# Served from cache for up to DASHBOARD_STATS_TIMEOUT seconds, refreshed in
+# the background once older than DASHBOARD_STATS_FRESH_FOR
+DASHBOARD_STATS_FRESH_FOR = 60
+DASHBOARD_STATS_TIMEOUT = 10 * 60
+
+
+def start_of_day(day):
+    """
+    Aware midnight at the start of ``day`` in the current time zone.
+
+    Filter datetime columns with ``__gte``/``__lt`` against these bounds rather
+    than ``__date`` lookups, which wrap the column in a function and keep the
+    database from using its index.
+    """
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def dashboard_stats_key(today):
+    return f'dash:v{get_cache_version(DASHBOARD_CACHE_VERSION)}:{today}'
+
+
+def dashboard_stats_payload(today):
+    """Compute the dashboard stats API body as encoded JSON bytes."""
+    members = SHAMember.objects.aggregate(
+        total=Count('id'),
+        pending=Count('id', filter=Q(status='pending')),
+    )
+    stats = {
+        'total_members': members['total'],
+        'pending_members': members['pending'],
+        'total_hospitals': Hospital.objects.count(),
+        'pending_claims': Claim.objects.filter(status='submitted').count(),
+        'today_visits': HospitalVisit.objects.filter(
+            visit_date__gte=start_of_day(today),
+            visit_date__lt=start_of_day(today + timedelta(days=1)),
+        ).count(),
+        'low_stock_alerts': PharmacyStock.objects.low_stock().count(),
+    }
+    return json.dumps(stats).encode()
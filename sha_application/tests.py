@@ -1,3 +1,581 @@
-from django.test import TestCase
+import datetime
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import IntegrityError, OperationalError, connection, transaction
+from django.http import HttpResponse
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from .audit import AuditLogBuffer, queue_audit_log
+from .models import (
+    User, County, SubCounty, SHAMember, Hospital, HospitalStaff, Employer, EmployerMember,
+    Contribution, HospitalVisit, Claim, AuditLog, PharmacyStock
+)
+from .paginators import CursorPaginator, KeysetPaginator
+
+
+def make_user(username, user_type='member'):
+    return User.objects.create_user(
+        username, f'{username}@example.com', 'pw',
+        phone_number=f'07{abs(hash(username)) % 10 ** 8:08d}', user_type=user_type
+    )
+
+
+def make_hospital(name, county, subcounty, number):
+    return Hospital.objects.create(
+        name=name, registration_number=f'H{number}', hospital_type='public', level=4,
+        email='h@example.com', phone_number='0700000000', postal_address='P.O. Box 1',
+        physical_address='Nairobi', county=county, subcounty=subcounty, license_number='L1',
+        license_expiry_date=datetime.date(2030, 1, 1), status='active'
+    )
+
+
+def make_member(number, county, subcounty):
+    return SHAMember.objects.create(
+        user=make_user(f'member{number}'), first_name=f'First{number}', last_name=f'Last{number}',
+        id_number=f'{10000000 + number}', date_of_birth=datetime.date(1990, 1, 1), gender='F',
+        phone_number='0700000000', email='m@example.com', physical_address='Nairobi',
+        county=county, subcounty=subcounty
+    )
+
+
+def make_employer(number, county):
+    return Employer.objects.create(
+        user=make_user(f'employer{number}', 'employer'), company_name=f'Company {number}',
+        registration_number=f'E{number}', tax_pin=f'P{number}', industry='Finance',
+        email='e@example.com', phone_number='0700000000', postal_address='P.O. Box 1',
+        physical_address='Nairobi', county=county, contact_person_name='Contact',
+        contact_person_phone='0700000000', contact_person_email='c@example.com', status='active'
+    )
+
+
+def make_visit(member, hospital):
+    return HospitalVisit.objects.create(
+        member=member, hospital=hospital, visit_type='consultation',
+        visit_date=timezone.now(), chief_complaint='Headache'
+    )
+
+
+class FixtureMixin:
+    @classmethod
+    def setUpTestData(cls):
+        cls.county = County.objects.create(name='Nairobi', code='047')
+        cls.subcounty = SubCounty.objects.create(county=cls.county, name='Westlands', code='01')
+
+
+# ============================================================================
+# PAGINATION
+# ============================================================================
+
+class CursorPaginatorTests(FixtureMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        # Tied sort keys, so paging relies on the id tie-breaker
+        for number, name in enumerate(['A', 'A', 'A', 'B', 'B', 'C', 'C']):
+            make_hospital(name, cls.county, cls.subcounty, number)
+        cls.expected = list(Hospital.objects.order_by('name', 'id').values_list('pk', flat=True))
+
+    def setUp(self):
+        cache.clear()
+
+    def walk_forward(self, paginator):
+        pages = [paginator.page(None)]
+        while pages[-1].has_next():
+            pages.append(paginator.page(pages[-1].next_cursor))
+        return pages
+
+    def test_forward_then_back_across_ties(self):
+        paginator = CursorPaginator(Hospital.objects.all(), ('name', 'id'), 3)
+        pages = self.walk_forward(paginator)
+        self.assertEqual([len(page) for page in pages], [3, 3, 1])
+        self.assertEqual([hospital.pk for page in pages for hospital in page], self.expected)
+        self.assertFalse(pages[0].has_previous())
+
+        back = [pages[-1]]
+        while back[-1].has_previous():
+            back.append(paginator.page(back[-1].previous_cursor))
+        self.assertEqual(
+            [[hospital.pk for hospital in page] for page in reversed(back)],
+            [[hospital.pk for hospital in page] for page in pages]
+        )
+
+    def test_datetime_cursor_keeps_microseconds(self):
+        members = [make_member(number, self.county, self.subcounty) for number in range(3)]
+        base = timezone.now().replace(microsecond=100000)
+        for offset, member in enumerate(members):
+            # Same millisecond, different microseconds
+            SHAMember.objects.filter(pk=member.pk).update(
+                registration_date=base + datetime.timedelta(microseconds=offset * 100)
+            )
+        paginator = CursorPaginator(SHAMember.objects.all(), ('-registration_date', '-id'), 1)
+
+        pages = self.walk_forward(paginator)
+        self.assertEqual([page[0].pk for page in pages], [m.pk for m in reversed(members)])
+        previous = paginator.page(pages[-1].previous_cursor)
+        self.assertEqual([member.pk for member in previous], [members[1].pk])
+
+    def test_total_is_counted_once_and_carried_in_cursors(self):
+        paginator = CursorPaginator(Hospital.objects.all(), ('name', 'id'), 3, with_count=True)
+        with CaptureQueriesContext(connection) as queries:
+            first = paginator.page(None)
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(first.count, 7)
+
+        second = paginator.page(first.next_cursor)
+        self.assertEqual(second.count, 7)
+        self.assertEqual(paginator.page(second.previous_cursor).count, 7)
+
+    def test_cached_total_skips_window_count(self):
+        def paginator():
+            return CursorPaginator(
+                Hospital.objects.filter(name='A'), ('name', 'id'), 2,
+                with_count=True, count_cache_key='test:hospital_count'
+            )
+
+        self.assertEqual(paginator().page(None).count, 3)
+        self.assertEqual(cache.get('test:hospital_count'), 3)
+        with CaptureQueriesContext(connection) as queries:
+            page = paginator().page(None)
+        self.assertEqual(page.count, 3)
+        self.assertNotIn('OVER', queries[0]['sql'])
+
+    def test_malformed_cursor_returns_first_page(self):
+        paginator = CursorPaginator(Hospital.objects.all(), ('name', 'id'), 3)
+        for cursor in ('not-base64!', 'bnVsbA', 'eyJkIjoieCJ9'):
+            page = paginator.page(cursor)
+            self.assertEqual([hospital.pk for hospital in page], self.expected[:3])
+            self.assertFalse(page.has_previous())
+
+
+class KeysetPaginatorTests(TestCase):
+    def test_pages_match_offset_pagination_with_tied_timestamps(self):
+        user = make_user('auditor', 'admin')
+        AuditLog.objects.bulk_create([
+            AuditLog(user=user, action_type='update', model_name='Claim', object_id=str(n), description='d')
+            for n in range(7)
+        ])
+        AuditLog.objects.filter(object_id__in=['1', '2', '3']).update(
+            timestamp=timezone.now() - datetime.timedelta(days=1)
+        )
+        logs = AuditLog.objects.order_by('-timestamp', '-id')
+        expected = list(logs.values_list('pk', flat=True))
+
+        paginator = KeysetPaginator(logs, 3)
+        pages = [
+            [log.pk for log in paginator.page(number).object_list]
+            for number in paginator.page_range
+        ]
+        self.assertEqual(pages, [expected[0:3], expected[3:6], expected[6:]])
+
+
+# ============================================================================
+# DASHBOARD
+# ============================================================================
+
+class AdminDashboardTests(FixtureMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.admin = make_user('admin', 'admin')
+        for number in range(5):
+            make_hospital(f'H{number}', cls.county, cls.subcounty, number)
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.admin)
+
+    def get_context(self):
+        with mock.patch('sha_application.views.render', return_value=HttpResponse()) as render:
+            self.client.get(reverse('admin_dashboard'))
+        return render.call_args.args[2]
+
+    def test_cached_dashboard_renders_top_hospitals_without_queries(self):
+        self.get_context()
+        # Session and user lookups only
+        with self.assertNumQueries(2):
+            context = self.get_context()
+            counties = [hospital.county.name for hospital in context['top_hospitals']]
+        self.assertEqual(counties, ['Nairobi'] * 5)
+
+
+class AdminPageCacheHeaderTests(TestCase):
+    def setUp(self):
+        self.client.force_login(make_user('admin', 'admin'))
+
+    def test_admin_pages_are_private_and_rendered_per_request(self):
+        for name in ('reports_dashboard', 'system_settings'):
+            with mock.patch('sha_application.views.render', return_value=HttpResponse()) as render:
+                first = self.client.get(reverse(name))
+                self.client.get(reverse(name))
+            self.assertEqual(render.call_count, 2)
+            cache_control = first['Cache-Control']
+            self.assertIn('private', cache_control)
+            self.assertNotIn('max-age', cache_control)
+
+
+class DashboardStatsApiTests(FixtureMixin, TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(make_user('admin', 'admin'))
+        self.url = reverse('dashboard_stats_api')
+
+    def test_unchanged_stats_return_304(self):
+        first = self.client.get(self.url)
+        self.assertEqual(first.status_code, 200)
+        self.assertIn('private', first['Cache-Control'])
+
+        repeat = self.client.get(self.url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(repeat.status_code, 304)
+        self.assertEqual(repeat.content, b'')
+
+    def test_changed_stats_return_a_new_etag(self):
+        first = self.client.get(self.url)
+        make_hospital('KNH', self.county, self.subcounty, 1)
+
+        changed = self.client.get(self.url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed['ETag'], first['ETag'])
+
+    def test_non_admin_is_denied_without_an_etag(self):
+        self.client.force_login(make_user('member', 'member'))
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 403)
+        self.assertNotIn('ETag', response)
+
+
+# ============================================================================
+# CLAIM REVIEW
+# ============================================================================
+
+class ClaimReviewTests(FixtureMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.admin = make_user('admin', 'admin')
+        hospital = make_hospital('KNH', cls.county, cls.subcounty, 1)
+        visit = make_visit(make_member(1, cls.county, cls.subcounty), hospital)
+        cls.claim = Claim.objects.create(
+            hospital=hospital, visit=visit, claim_type='consultation',
+            amount_claimed=Decimal('100.00')
+        )
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def review(self, **data):
+        with mock.patch('sha_application.views.render', return_value=HttpResponse()) as render, \
+                mock.patch('sha_application.views.queue_audit_log') as audit:
+            self.client.post(reverse('claim_detail', args=[self.claim.pk]), data)
+        request, _, context = render.call_args.args
+        # render is stubbed, so earlier messages are never consumed
+        return context['claim'], audit, str(list(get_messages(request))[-1])
+
+    def test_approve_updates_submitted_claim_and_audits_once(self):
+        claim, audit, message = self.review(action='approve', approved_amount='80.50')
+        self.assertEqual(claim.status, 'approved')
+        self.assertEqual(claim.amount_approved, Decimal('80.50'))
+        self.assertEqual(claim.reviewed_by, self.admin)
+        self.assertEqual(audit.call_count, 1)
+        self.assertEqual(message, 'Claim approved for KSh 80.50')
+
+    def test_second_review_does_not_overwrite_or_audit(self):
+        self.review(action='approve', approved_amount='80.50')
+        claim, audit, message = self.review(action='reject', rejection_reason='Duplicate')
+        self.assertEqual(claim.status, 'approved')
+        self.assertEqual(claim.rejection_reason, '')
+        audit.assert_not_called()
+        self.assertEqual(message, 'Claim is not in submitted status.')
+
+    def test_invalid_amount_is_a_form_error(self):
+        for amount in ('abc', ''):
+            claim, audit, message = self.review(action='approve', approved_amount=amount)
+            self.assertEqual(claim.status, 'submitted')
+            audit.assert_not_called()
+            self.assertEqual(message, 'Invalid approved amount.')
+
+
+# ============================================================================
+# GENERATED NUMBERS
+# ============================================================================
+
+class UniqueNumberMixinTests(FixtureMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.hospital = make_hospital('KNH', cls.county, cls.subcounty, 1)
+        cls.visit = make_visit(make_member(1, cls.county, cls.subcounty), cls.hospital)
+        Claim.objects.create(
+            hospital=cls.hospital, visit=cls.visit, claim_type='consultation',
+            amount_claimed=Decimal('100.00'), claim_number='CLM-TAKEN'
+        )
+
+    def new_claim(self):
+        return Claim(
+            hospital=self.hospital, visit=self.visit, claim_type='consultation',
+            amount_claimed=Decimal('50.00')
+        )
+
+    def test_collision_is_retried_with_a_fresh_number(self):
+        claim = self.new_claim()
+        with mock.patch.object(Claim, 'generate_claim_number', side_effect=['CLM-TAKEN', 'CLM-FRESH']):
+            claim.save()
+        self.assertEqual(Claim.objects.get(pk=claim.pk).claim_number, 'CLM-FRESH')
+
+    def test_gives_up_after_the_attempt_limit(self):
+        claim = self.new_claim()
+        with mock.patch.object(Claim, 'generate_claim_number', return_value='CLM-TAKEN') as generate:
+            with self.assertRaises(IntegrityError):
+                claim.save()
+        self.assertEqual(generate.call_count, Claim.NUMBER_ATTEMPTS)
+        self.assertEqual(claim.claim_number, '')
+        self.assertIsNone(claim.pk)
+
+
+# ============================================================================
+# DENORMALIZED COUNTERS
+# ============================================================================
+
+class CounterSignalTests(FixtureMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.first = make_hospital('First', cls.county, cls.subcounty, 1)
+        cls.second = make_hospital('Second', cls.county, cls.subcounty, 2)
+        cls.member = make_member(1, cls.county, cls.subcounty)
+
+    def assertCounts(self, field, first, second):
+        self.assertEqual(
+            list(Hospital.objects.order_by('pk').values_list(field, flat=True)), [first, second]
+        )
+
+    def test_active_staff_count_on_create_reassign_and_delete(self):
+        staff = HospitalStaff.objects.create(
+            user=make_user('doctor', 'hospital'), hospital=self.first, staff_number='S1',
+            role='doctor', date_joined=datetime.date(2020, 1, 1)
+        )
+        self.assertCounts('active_staff_count', 1, 0)
+
+        staff.hospital = self.second
+        staff.save()
+        self.assertCounts('active_staff_count', 0, 1)
+
+        staff.is_active = False
+        staff.save()
+        self.assertCounts('active_staff_count', 0, 0)
+
+        staff.is_active = True
+        staff.save()
+        staff.delete()
+        self.assertCounts('active_staff_count', 0, 0)
+
+    def test_visit_count_on_create_reassign_and_delete(self):
+        visit = make_visit(self.member, self.first)
+        make_visit(self.member, self.first)
+        self.assertCounts('visit_count', 2, 0)
+
+        visit = HospitalVisit.objects.get(pk=visit.pk)
+        visit.hospital = self.second
+        visit.save()
+        self.assertCounts('visit_count', 1, 1)
+
+        with CaptureQueriesContext(connection) as queries:
+            visit.status = 'completed'
+            visit.save()
+        self.assertEqual(len(queries), 1)
+        self.assertCounts('visit_count', 1, 1)
+
+        visit.delete()
+        self.assertCounts('visit_count', 1, 0)
+
+    def test_member_contribution_totals_follow_completed_contributions(self):
+        month = datetime.date(2026, 1, 1)
+        contribution = Contribution.objects.create(
+            member=self.member, contribution_type='individual', amount=Decimal('500.00'),
+            contribution_month=month, payment_date=timezone.now(), payment_method='mpesa',
+            payment_reference='REF1', status='completed'
+        )
+        self.member.refresh_from_db()
+        self.assertEqual(self.member.total_contributed, Decimal('500.00'))
+        self.assertEqual(self.member.last_contribution_month, month)
+
+        contribution.status = 'refunded'
+        contribution.save()
+        self.member.refresh_from_db()
+        self.assertEqual(self.member.total_contributed, Decimal('0.00'))
+        self.assertIsNone(self.member.last_contribution_month)
+
+
+# ============================================================================
+# PHARMACY
+# ============================================================================
+
+class PharmacyStockExpiryTests(SimpleTestCase):
+    def test_expiry_follows_the_local_date(self):
+        stock = PharmacyStock(expiry_date=datetime.date(2026, 3, 1))
+        # 01:00 on 2 March in Nairobi, still 1 March in UTC
+        late_evening_utc = datetime.datetime(2026, 3, 1, 22, 0, tzinfo=datetime.timezone.utc)
+        with mock.patch('django.utils.timezone.now', return_value=late_evening_utc):
+            self.assertTrue(stock.is_expired())
+
+
+# ============================================================================
+# MANAGEMENT COMMANDS
+# ============================================================================
+
+class PostMonthlyContributionsTests(FixtureMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.first = make_employer(1, cls.county)
+        cls.second = make_employer(2, cls.county)
+        cls.member = make_member(1, cls.county, cls.subcounty)
+        cls.other = make_member(2, cls.county, cls.subcounty)
+        for employer, member, salary in [
+            (cls.second, cls.member, '20000.00'),
+            (cls.first, cls.member, '10000.00'),
+            (cls.first, cls.other, '40000.00'),
+        ]:
+            EmployerMember.objects.create(
+                employer=employer, member=member, employee_number=f'N{member.pk}',
+                monthly_salary=Decimal(salary), date_joined=datetime.date(2020, 1, 1)
+            )
+
+    def post(self, month='2026-03'):
+        out = StringIO()
+        call_command('post_monthly_contributions', month, stdout=out)
+        return out.getvalue()
+
+    def test_member_with_two_employers_gets_one_summed_row(self):
+        output = self.post()
+        self.assertIn('Posted 2 contributions for March 2026.', output)
+        self.assertIn('Summed 1 additional employer contributions', output)
+
+        contribution = Contribution.objects.get(member=self.member)
+        self.assertEqual(contribution.amount, Decimal('825.00'))
+        self.assertEqual(contribution.employer, self.first)
+        self.assertEqual(contribution.contribution_month, datetime.date(2026, 3, 1))
+        self.assertEqual(Contribution.objects.get(member=self.other).amount, Decimal('1100.00'))
+
+    def test_rerun_skips_members_already_posted(self):
+        self.post()
+        output = self.post()
+        self.assertIn('Posted 0 contributions', output)
+        self.assertEqual(Contribution.objects.count(), 2)
+
+
+# ============================================================================
+# AUDIT LOG BUFFER
+# ============================================================================
+
+class AuditLogBufferTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = make_user('auditor', 'admin')
+
+    def setUp(self):
+        self.buffer = AuditLogBuffer(batch_size=3, max_retries=1, max_queue_size=5)
+        # Keep the background writer out of the test transaction
+        patcher = mock.patch.object(self.buffer, '_ensure_worker')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def entry(self, object_id, description='d'):
+        return AuditLog(
+            user=self.user, action_type='update', model_name='Claim',
+            object_id=str(object_id), description=description
+        )
+
+    def logged_ids(self):
+        return sorted(AuditLog.objects.values_list('object_id', flat=True))
+
+    def test_flush_writes_queued_entries_in_batches(self):
+        for n in range(5):
+            self.buffer.put(self.entry(n))
+        with CaptureQueriesContext(connection) as queries:
+            self.buffer.flush()
+        inserts = [q for q in queries if q['sql'].startswith('INSERT')]
+        self.assertEqual(len(inserts), 2)
+        self.assertEqual(self.logged_ids(), ['0', '1', '2', '3', '4'])
+
+    def test_full_queue_drops_new_entries(self):
+        with self.assertLogs('sha_application.audit', 'ERROR') as logs:
+            for n in range(7):
+                self.buffer.put(self.entry(n))
+        self.assertEqual(len(logs.records), 2)
+        self.buffer.flush()
+        self.assertEqual(self.logged_ids(), ['0', '1', '2', '3', '4'])
+
+    def test_rejected_row_is_dropped_and_the_rest_written(self):
+        self.buffer.put(self.entry(1))
+        self.buffer.put(self.entry(2, description=None))
+        self.buffer.put(self.entry(3))
+        self.buffer.put(self.entry(4))
+        with self.assertLogs('sha_application.audit', 'ERROR'):
+            self.buffer.flush()
+        self.assertEqual(self.logged_ids(), ['1', '3', '4'])
+
+        self.buffer.put(self.entry(5))
+        self.buffer.flush()
+        self.assertEqual(self.logged_ids(), ['1', '3', '4', '5'])
+
+    def test_unwritable_batch_is_retried_then_dropped(self):
+        self.buffer.put(self.entry(1))
+        with mock.patch.object(AuditLog.objects, 'bulk_create', side_effect=OperationalError), \
+                mock.patch.object(AuditLog, 'save', side_effect=OperationalError):
+            with self.assertRaises(OperationalError):
+                self.buffer.flush()
+        # Kept for the next flush
+        self.buffer.flush()
+        self.assertEqual(self.logged_ids(), ['1'])
+
+        self.buffer.put(self.entry(2))
+        with mock.patch.object(AuditLog.objects, 'bulk_create', side_effect=OperationalError), \
+                mock.patch.object(AuditLog, 'save', side_effect=OperationalError):
+            with self.assertRaises(OperationalError):
+                self.buffer.flush()
+            with self.assertLogs('sha_application.audit', 'ERROR'):
+                with self.assertRaises(OperationalError):
+                    self.buffer.flush()
+        self.buffer.flush()
+        self.assertEqual(self.logged_ids(), ['1'])
+
+    def test_entries_from_rolled_back_transactions_are_dropped(self):
+        stamped = timezone.now() - datetime.timedelta(hours=1)
+        with mock.patch('sha_application.audit.audit_buffer', self.buffer):
+            with self.captureOnCommitCallbacks(execute=True):
+                queue_audit_log(
+                    user=self.user, action_type='update', model_name='Claim', object_id='1',
+                    description='kept', timestamp=stamped
+                )
+                try:
+                    with transaction.atomic():
+                        queue_audit_log(
+                            user=self.user, action_type='update', model_name='Claim',
+                            object_id='2', description='rolled back'
+                        )
+                        raise RuntimeError
+                except RuntimeError:
+                    pass
+        self.buffer.flush()
+        self.assertEqual(self.logged_ids(), ['1'])
+        self.assertEqual(AuditLog.objects.get().timestamp, stamped)
+
+    def test_entries_are_stamped_when_queued(self):
+        with mock.patch('sha_application.audit.audit_buffer', self.buffer):
+            with self.captureOnCommitCallbacks(execute=True):
+                queue_audit_log(
+                    user=self.user, action_type='update', model_name='Claim', object_id='1',
+                    description='d'
+                )
+        queued_at = timezone.now()
+        with mock.patch('django.utils.timezone.now', return_value=queued_at + datetime.timedelta(minutes=5)):
+            self.buffer.flush()
+        self.assertLessEqual(AuditLog.objects.get().timestamp, queued_at)
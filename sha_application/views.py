@@ -3,24 +3,152 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.db.models import Count, Sum, Q
+from django.db import transaction
+from django.db.models import (
+    Count, Sum, Q, OuterRef, Subquery, IntegerField, DecimalField, Prefetch
+)
 from django.utils import timezone
-from django.http import JsonResponse
-from django.core.paginator import Paginator
-from django.db.models.functions import TruncMonth, TruncDate
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.core.cache import cache
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
+from django.db.models.functions import TruncMonth, TruncDate, Coalesce
 from datetime import datetime, timedelta
-from decimal import Decimal
+from functools import wraps
+import csv
+import hashlib
+import re
+from urllib.parse import urlencode
+from decimal import Decimal, InvalidOperation
 
 from .models import (
     User, SHAMember, Employer, Hospital, HospitalStaff, Contribution,
     HospitalVisit, Prescription, Claim, Notification, AuditLog,
-    County, SubCounty, Medicine, PharmacyStock
+    SubCounty, Medicine, PharmacyStock
+)
+from .audit import queue_audit_log
+from .paginators import CursorPaginator
+from .caching import (
+    DASHBOARD_CACHE_VERSION, bump_cache_version, get_audit_model_names, get_cache_version,
+    get_counties, get_stale_while_revalidate
+)
+from .stats import (
+    DASHBOARD_STATS_FRESH_FOR, DASHBOARD_STATS_TIMEOUT,
+    dashboard_stats_key, dashboard_stats_payload, start_of_day
+)
+
+# Wide columns that list pages never render; deferred to keep rows narrow
+MEMBER_DEFERRED_FIELDS = ('physical_address', 'fingerprint_template')
+VISIT_DEFERRED_FIELDS = ('chief_complaint', 'consultation_notes', 'diagnosis', 'treatment_plan')
+CLAIM_LIST_DEFERRED_FIELDS = (
+    'rejection_reason', 'review_notes',
+    *(f'visit__{name}' for name in VISIT_DEFERRED_FIELDS),
+    *(f'visit__member__{name}' for name in MEMBER_DEFERRED_FIELDS),
+)
+
+# Columns rendered by the paginated list pages; everything else stays in the database
+MEMBER_LIST_FIELDS = (
+    'sha_number', 'first_name', 'middle_name', 'last_name', 'id_number', 'phone_number',
+    'status', 'registration_date', 'county__name', 'subcounty__name',
+)
+HOSPITAL_LIST_FIELDS = (
+    'name', 'registration_number', 'hospital_type', 'level', 'phone_number', 'status',
+    'registration_date', 'active_staff_count', 'county__name', 'subcounty__name',
+)
+CLAIM_LIST_FIELDS = (
+    'claim_number', 'claim_type', 'amount_claimed', 'amount_approved', 'status',
+    'submitted_date', 'reviewed_date', 'hospital__name', 'hospital__county__name',
+    'visit__visit_number', 'visit__member__sha_number', 'visit__member__first_name',
+    'visit__member__last_name', 'visit__member__county__name',
+    'reviewed_by__username', 'reviewed_by__first_name', 'reviewed_by__last_name',
+)
+AUDIT_LOG_LIST_FIELDS = (
+    'action_type', 'model_name', 'object_id', 'description', 'ip_address', 'timestamp',
+    'user__username', 'user__first_name', 'user__last_name',
 )
 
+# Columns of the financial report's contribution CSV export
+CONTRIBUTION_EXPORT_FIELDS = (
+    'payment_date', 'payment_reference', 'member__sha_number', 'employer__company_name',
+    'contribution_type', 'contribution_month', 'payment_method', 'amount',
+)
+
+class Echo:
+    """Pseudo-buffer for csv.writer: write() returns the row instead of storing it."""
+    def write(self, value):
+        return value
+
+# SHA numbers (stored upper-case) are matched by prefix and complete ID
+# numbers exactly, so the unique indexes can answer them
+SHA_NUMBER_RE = re.compile(r'^SHA\d+$', re.IGNORECASE)
+ID_NUMBER_RE = re.compile(r'^\d{8}$')
+
+def member_search_filter(search_query):
+    """Pick the narrowest member lookup that fits the shape of ``search_query``."""
+    search_query = search_query.strip()
+    if SHA_NUMBER_RE.match(search_query):
+        return Q(sha_number__startswith=search_query.upper())
+    if ID_NUMBER_RE.match(search_query):
+        return Q(id_number=search_query)
+    name_match = Q(first_name__icontains=search_query) | Q(last_name__icontains=search_query)
+    if any(char.isdigit() for char in search_query):
+        # Possibly a partial SHA or ID number
+        return name_match | Q(sha_number__icontains=search_query) | Q(id_number__icontains=search_query)
+    return name_match
+
+def list_count_cache_key(request, view_name):
+    """
+    Cache key for a list view's total under the current filters.
+
+    The dashboard cache version is part of the key, so member, hospital and
+    claim changes start a fresh count; audit log totals rely on the timeout.
+    """
+    filters = sorted((key, value) for key, value in request.GET.items() if key != 'cursor')
+    signature = hashlib.md5(urlencode(filters).encode(), usedforsecurity=False).hexdigest()
+    return f'list_count:{view_name}:v{get_cache_version(DASHBOARD_CACHE_VERSION)}:{signature}'
+
+def related_aggregate(model, fk_name, aggregate, **filters):
+    """Correlated subquery computing ``aggregate`` over ``model`` rows that point at the outer row."""
+    return Subquery(
+        model.objects.filter(**{fk_name: OuterRef('pk')}, **filters)
+        .order_by()
+        .values(fk_name)
+        .annotate(value=aggregate)
+        .values('value')
+    )
+
+def visit_hospital_prefetch():
+    # Many visits share a hospital; fetch each one once instead of joining
+    # its full row onto every visit.
+    return Prefetch('hospital', queryset=Hospital.objects.only('id', 'name'))
+
+def visit_staff_prefetch():
+    return Prefetch(
+        'attending_staff',
+        queryset=HospitalStaff.objects.select_related('user', 'hospital').only(
+            'id', 'role', 'user__first_name', 'user__last_name', 'hospital__name'
+        )
+    )
+
 # ============================================================================
 # AUTHENTICATION VIEWS
 # ============================================================================
 
+def admin_required(view_func):
+    """
+    Restrict a view to logged-in admin users.
+
+    Anonymous requests are sent to the admin login page by
+    ``login_required``; other user types go there with an error message.
+    """
+    @wraps(view_func)
+    def _wrapped_view(request, *args, **kwargs):
+        if request.user.user_type != 'admin':
+            messages.error(request, 'Access denied.')
+            return redirect('admin_login')
+        return view_func(request, *args, **kwargs)
+    return login_required(_wrapped_view, login_url='admin_login')
+
 def admin_login(request):
     """Admin login view"""
     if request.user.is_authenticated and request.user.user_type == 'admin':
@@ -35,7 +163,7 @@ def admin_login(request):
         if user is not None and user.user_type == 'admin':
             login(request, user)
             # Log the login
-            AuditLog.objects.create(
+            queue_audit_log(
                 user=user,
                 action_type='login',
                 model_name='User',
@@ -51,12 +179,12 @@ def admin_login(request):
     
     return render(request, 'admin/login.html')
 
-@login_required
+@login_required(login_url='admin_login')
 def admin_logout(request):
     """Admin logout view"""
     if request.user.user_type == 'admin':
         # Log the logout
-        AuditLog.objects.create(
+        queue_audit_log(
             user=request.user,
             action_type='logout',
             model_name='User',
@@ -74,68 +202,120 @@ def admin_logout(request):
 # DASHBOARD VIEWS
 # ============================================================================
 
-@login_required
+# The context is shared by all admins; querysets are evaluated to lists so
+# the cached value holds rows, not lazy queries.
+DASHBOARD_CONTEXT_TIMEOUT = 60
+# Trend series change slowly and are the heaviest scans; rebuilt hourly
+# rather than on every dashboard version bump.
+DASHBOARD_TRENDS_TIMEOUT = 60 * 60
+
+@admin_required
 def admin_dashboard(request):
     """Main admin dashboard with statistics"""
-    if request.user.user_type != 'admin':
-        messages.error(request, 'Access denied. Admin privileges required.')
-        return redirect('admin_login')
+    today = timezone.localdate()
+    key = f'admin_dashboard:v{get_cache_version(DASHBOARD_CACHE_VERSION)}:{today}'
+    context = cache.get_or_set(
+        key, lambda: _build_dashboard_context(today), timeout=DASHBOARD_CONTEXT_TIMEOUT
+    )
     
+    return render(request, 'admin/dashboard.html', context)
+
+def _build_dashboard_context(today):
     # Get current date ranges
-    today = timezone.now().date()
     this_month_start = today.replace(day=1)
     last_month_start = (this_month_start - timedelta(days=1)).replace(day=1)
     this_year = today.year
     
-    # Basic statistics
-    total_members = SHAMember.objects.count()
-    active_members = SHAMember.objects.filter(status='active').count()
-    pending_members = SHAMember.objects.filter(status='pending').count()
-    
-    total_hospitals = Hospital.objects.count()
-    active_hospitals = Hospital.objects.filter(status='active').count()
-    pending_hospitals = Hospital.objects.filter(status='pending').count()
-    
-    total_employers = Employer.objects.count()
-    active_employers = Employer.objects.filter(status='active').count()
+    # Basic statistics: one conditional aggregate per table
+    status_counts = dict(
+        total=Count('id'),
+        active=Count('id', filter=Q(status='active')),
+        pending=Count('id', filter=Q(status='pending')),
+    )
+    member_stats = SHAMember.objects.aggregate(**status_counts)
+    hospital_stats = Hospital.objects.aggregate(**status_counts)
+    employer_stats = Employer.objects.aggregate(**status_counts)
     
     # Financial statistics
-    total_contributions = Contribution.objects.filter(status='completed').aggregate(
-        total=Sum('amount')
-    )['total'] or Decimal('0.00')
-    
-    this_month_contributions = Contribution.objects.filter(
-        status='completed',
-        payment_date__gte=this_month_start
-    ).aggregate(total=Sum('amount'))['total'] or Decimal('0.00')
+    contribution_stats = Contribution.objects.filter(status='completed').aggregate(
+        total=Sum('amount'),
+        this_month=Sum('amount', filter=Q(payment_date__gte=start_of_day(this_month_start))),
+    )
     
     # Claims statistics
-    total_claims = Claim.objects.count()
-    pending_claims = Claim.objects.filter(status='submitted').count()
-    approved_claims = Claim.objects.filter(status='approved').count()
-    
-    total_claims_amount = Claim.objects.aggregate(
-        total=Sum('amount_claimed')
-    )['total'] or Decimal('0.00')
+    claim_stats = Claim.objects.aggregate(
+        total=Count('id'),
+        pending=Count('id', filter=Q(status='submitted')),
+        approved=Count('id', filter=Q(status='approved')),
+        amount=Sum('amount_claimed'),
+    )
     
     # Hospital visits
-    total_visits = HospitalVisit.objects.count()
-    this_month_visits = HospitalVisit.objects.filter(
-        visit_date__gte=this_month_start
-    ).count()
+    visit_stats = HospitalVisit.objects.aggregate(
+        total=Count('id'),
+        this_month=Count('id', filter=Q(visit_date__gte=start_of_day(this_month_start))),
+    )
     
     # Recent activities
-    recent_members = SHAMember.objects.select_related('county').order_by('-registration_date')[:10]
-    recent_claims = Claim.objects.select_related('hospital', 'visit__member').order_by('-submitted_date')[:10]
-    pending_approvals = SHAMember.objects.filter(status='pending').count() + \
-                       Hospital.objects.filter(status='pending').count() + \
-                       Employer.objects.filter(status='pending').count()
+    recent_members = SHAMember.objects.select_related('county').defer(
+        *MEMBER_DEFERRED_FIELDS
+    ).order_by('-registration_date')[:10]
+    recent_claims = Claim.objects.select_related('hospital', 'visit__member').defer(
+        *CLAIM_LIST_DEFERRED_FIELDS
+    ).order_by('-submitted_date')[:10]
+    pending_approvals = (
+        member_stats['pending'] + hospital_stats['pending'] + employer_stats['pending']
+    )
+    
+    trends = cache.get_or_set(
+        f'admin_dashboard:trends:{today}',
+        lambda: _build_dashboard_trends(today),
+        timeout=DASHBOARD_TRENDS_TIMEOUT
+    )
+    
+    # Top hospitals by visits
+    top_hospitals = Hospital.objects.select_related('county').order_by('-visit_count')[:5]
+    
+    # System alerts
+    stock_alerts = PharmacyStock.objects.alert_counts()
+    
+    context = {
+        'total_members': member_stats['total'],
+        'active_members': member_stats['active'],
+        'pending_members': member_stats['pending'],
+        'total_hospitals': hospital_stats['total'],
+        'active_hospitals': hospital_stats['active'],
+        'pending_hospitals': hospital_stats['pending'],
+        'total_employers': employer_stats['total'],
+        'active_employers': employer_stats['active'],
+        'total_contributions': contribution_stats['total'] or Decimal('0.00'),
+        'this_month_contributions': contribution_stats['this_month'] or Decimal('0.00'),
+        'total_claims': claim_stats['total'],
+        'pending_claims': claim_stats['pending'],
+        'approved_claims': claim_stats['approved'],
+        'total_claims_amount': claim_stats['amount'] or Decimal('0.00'),
+        'total_visits': visit_stats['total'],
+        'this_month_visits': visit_stats['this_month'],
+        'recent_members': list(recent_members),
+        'recent_claims': list(recent_claims),
+        'pending_approvals': pending_approvals,
+        'monthly_contributions': trends['monthly_contributions'],
+        'daily_visits': trends['daily_visits'],
+        'top_hospitals': list(top_hospitals),
+        'low_stock_medicines': stock_alerts['low_stock'],
+        'expired_medicines': stock_alerts['expired'],
+    }
+    
+    return context
+
+def _build_dashboard_trends(today):
+    this_month_start = today.replace(day=1)
     
     # Monthly contribution trends (last 6 months)
     six_months_ago = this_month_start - timedelta(days=180)
     monthly_contributions = Contribution.objects.filter(
         status='completed',
-        payment_date__gte=six_months_ago
+        payment_date__gte=start_of_day(six_months_ago)
     ).annotate(
         month=TruncMonth('payment_date')
     ).values('month').annotate(
@@ -146,68 +326,26 @@ def admin_dashboard(request):
     # Daily visits trend (last 30 days)
     thirty_days_ago = today - timedelta(days=30)
     daily_visits = HospitalVisit.objects.filter(
-        visit_date__gte=thirty_days_ago
+        visit_date__gte=start_of_day(thirty_days_ago)
     ).annotate(
         date=TruncDate('visit_date')
     ).values('date').annotate(
         count=Count('id')
     ).order_by('date')
     
-    # Top hospitals by visits
-    top_hospitals = Hospital.objects.annotate(
-        visit_count=Count('patient_visits')
-    ).order_by('-visit_count')[:5]
-    
-    # System alerts
-    low_stock_medicines = PharmacyStock.objects.filter(
-        current_stock__lte=models.F('minimum_stock_level')
-    ).select_related('hospital', 'medicine').count()
-    
-    expired_medicines = PharmacyStock.objects.filter(
-        expiry_date__lt=today
-    ).count()
-    
-    context = {
-        'total_members': total_members,
-        'active_members': active_members,
-        'pending_members': pending_members,
-        'total_hospitals': total_hospitals,
-        'active_hospitals': active_hospitals,
-        'pending_hospitals': pending_hospitals,
-        'total_employers': total_employers,
-        'active_employers': active_employers,
-        'total_contributions': total_contributions,
-        'this_month_contributions': this_month_contributions,
-        'total_claims': total_claims,
-        'pending_claims': pending_claims,
-        'approved_claims': approved_claims,
-        'total_claims_amount': total_claims_amount,
-        'total_visits': total_visits,
-        'this_month_visits': this_month_visits,
-        'recent_members': recent_members,
-        'recent_claims': recent_claims,
-        'pending_approvals': pending_approvals,
+    return {
         'monthly_contributions': list(monthly_contributions),
         'daily_visits': list(daily_visits),
-        'top_hospitals': top_hospitals,
-        'low_stock_medicines': low_stock_medicines,
-        'expired_medicines': expired_medicines,
     }
-    
-    return render(request, 'admin/dashboard.html', context)
 
 # ============================================================================
 # MEMBER MANAGEMENT VIEWS
 # ============================================================================
 
-@login_required
+@admin_required
 def members_list(request):
     """List all SHA members with filtering and pagination"""
-    if request.user.user_type != 'admin':
-        messages.error(request, 'Access denied.')
-        return redirect('admin_login')
-    
-    members = SHAMember.objects.select_related('county', 'subcounty').all()
+    members = SHAMember.objects.select_related('county', 'subcounty').only(*MEMBER_LIST_FIELDS)
     
     # Filtering
     status_filter = request.GET.get('status')
@@ -221,20 +359,17 @@ def members_list(request):
         members = members.filter(county_id=county_filter)
     
     if search_query:
-        members = members.filter(
-            Q(sha_number__icontains=search_query) |
-            Q(first_name__icontains=search_query) |
-            Q(last_name__icontains=search_query) |
-            Q(id_number__icontains=search_query)
-        )
+        members = members.filter(member_search_filter(search_query))
     
     # Pagination
-    paginator = Paginator(members, 25)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    paginator = CursorPaginator(
+        members, ('-registration_date', '-id'), 25,
+        with_count=True, count_cache_key=list_count_cache_key(request, 'members')
+    )
+    page_obj = paginator.page(request.GET.get('cursor'))
     
     # Get filter options
-    counties = County.objects.all()
+    counties = get_counties()
     status_choices = SHAMember.MEMBER_STATUS
     
     context = {
@@ -248,27 +383,27 @@ def members_list(request):
     
     return render(request, 'admin/members/list.html', context)
 
-@login_required
+@admin_required
 def member_detail(request, member_id):
     """View detailed information about a specific member"""
-    if request.user.user_type != 'admin':
-        messages.error(request, 'Access denied.')
-        return redirect('admin_login')
-    
-    member = get_object_or_404(SHAMember, id=member_id)
+    # Visit count is a correlated subquery so it arrives with the member row
+    member = get_object_or_404(
+        SHAMember.objects.select_related('user', 'county', 'subcounty', 'approved_by').annotate(
+            _total_visits=Coalesce(
+                related_aggregate(HospitalVisit, 'member', Count('pk')), 0,
+                output_field=IntegerField()
+            ),
+        ),
+        id=member_id
+    )
     
     # Get related data
     contributions = member.contributions.order_by('-payment_date')[:10]
-    hospital_visits = member.hospital_visits.select_related('hospital').order_by('-visit_date')[:10]
+    hospital_visits = member.hospital_visits.defer(*VISIT_DEFERRED_FIELDS).prefetch_related(
+        visit_hospital_prefetch(), visit_staff_prefetch()
+    ).order_by('-visit_date')[:10]
     employers = member.employers.select_related('employer').filter(is_active=True)
-    documents = member.documents.order_by('-uploaded_at')
-    
-    # Statistics
-    total_contributions = member.contributions.filter(status='completed').aggregate(
-        total=Sum('amount')
-    )['total'] or Decimal('0.00')
-    
-    total_visits = member.hospital_visits.count()
+    documents = member.documents.select_related('verified_by').order_by('-uploaded_at')
     
     context = {
         'member': member,
@@ -276,49 +411,52 @@ def member_detail(request, member_id):
         'hospital_visits': hospital_visits,
         'employers': employers,
         'documents': documents,
-        'total_contributions': total_contributions,
-        'total_visits': total_visits,
+        'total_contributions': member.total_contributed,
+        'total_visits': member._total_visits,
     }
     
     return render(request, 'admin/members/detail.html', context)
 
-@login_required
+@admin_required
 def approve_member(request, member_id):
     """Approve a pending member"""
-    if request.user.user_type != 'admin':
-        messages.error(request, 'Access denied.')
-        return redirect('admin_login')
-    
     member = get_object_or_404(SHAMember, id=member_id)
     
     if request.method == 'POST':
-        if member.status == 'pending':
-            member.status = 'active'
-            member.approval_date = timezone.now()
-            member.approved_by = request.user
-            member.save()
-            
-            # Log the approval
-            AuditLog.objects.create(
-                user=request.user,
-                action_type='approval',
-                model_name='SHAMember',
-                object_id=str(member.id),
-                description=f'Member {member.sha_number} approved by {request.user.username}',
-                ip_address=request.META.get('REMOTE_ADDR'),
-                user_agent=request.META.get('HTTP_USER_AGENT', '')
-            )
-            
-            # Send notification to member
-            Notification.objects.create(
-                recipient_user=member.user,
-                notification_type='registration_approved',
-                method='sms',
-                title='SHA Registration Approved',
-                message=f'Your SHA registration has been approved. Your SHA number is {member.sha_number}.',
-                phone_number=member.phone_number
+        with transaction.atomic():
+            # Conditional UPDATE so two admins cannot both approve the same member
+            approved = SHAMember.objects.filter(id=member.id, status='pending').update(
+                status='active',
+                approval_date=timezone.now(),
+                approved_by=request.user
             )
             
+            if approved:
+                # Log the approval
+                queue_audit_log(
+                    user=request.user,
+                    action_type='approval',
+                    model_name='SHAMember',
+                    object_id=str(member.id),
+                    description=f'Member {member.sha_number} approved by {request.user.username}',
+                    ip_address=request.META.get('REMOTE_ADDR'),
+                    user_agent=request.META.get('HTTP_USER_AGENT', '')
+                )
+                
+                # Send notification to member
+                Notification.objects.create(
+                    recipient_user_id=member.user_id,
+                    notification_type='registration_approved',
+                    method='sms',
+                    title='SHA Registration Approved',
+                    message=f'Your SHA registration has been approved. Your SHA number is {member.sha_number}.',
+                    phone_number=member.phone_number
+                )
+                
+                # update() skips post_save, so invalidate the dashboard cache here
+                transaction.on_commit(lambda: bump_cache_version(DASHBOARD_CACHE_VERSION))
+        
+        if approved:
             messages.success(request, f'Member {member.sha_number} has been approved successfully.')
         else:
             messages.warning(request, 'Member is not in pending status.')
@@ -329,14 +467,10 @@ def approve_member(request, member_id):
 # HOSPITAL MANAGEMENT VIEWS
 # ============================================================================
 
-@login_required
+@admin_required
 def hospitals_list(request):
     """List all hospitals with filtering"""
-    if request.user.user_type != 'admin':
-        messages.error(request, 'Access denied.')
-        return redirect('admin_login')
-    
-    hospitals = Hospital.objects.select_related('county', 'subcounty').all()
+    hospitals = Hospital.objects.select_related('county', 'subcounty').only(*HOSPITAL_LIST_FIELDS)
     
     # Filtering
     status_filter = request.GET.get('status')
@@ -360,12 +494,14 @@ def hospitals_list(request):
         )
     
     # Pagination
-    paginator = Paginator(hospitals, 25)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    paginator = CursorPaginator(
+        hospitals, ('name', 'id'), 25,
+        with_count=True, count_cache_key=list_count_cache_key(request, 'hospitals')
+    )
+    page_obj = paginator.page(request.GET.get('cursor'))
     
     # Get filter options
-    counties = County.objects.all()
+    counties = get_counties()
     status_choices = Hospital.HOSPITAL_STATUS
     type_choices = Hospital.HOSPITAL_TYPES
     
@@ -382,39 +518,64 @@ def hospitals_list(request):
     
     return render(request, 'admin/hospitals/list.html', context)
 
-@login_required
+@admin_required
 def hospital_detail(request, hospital_id):
     """View detailed information about a specific hospital"""
-    if request.user.user_type != 'admin':
-        messages.error(request, 'Access denied.')
-        return redirect('admin_login')
-    
-    hospital = get_object_or_404(Hospital, id=hospital_id)
-    
-    # Get related data
-    staff = hospital.staff.select_related('user')[:10]
-    recent_visits = hospital.patient_visits.select_related('member').order_by('-visit_date')[:10]
-    claims = hospital.claims.order_by('-submitted_date')[:10]
-    pharmacy_stock = hospital.pharmacy_stock.select_related('medicine').order_by('-updated_at')[:10]
-    
-    # Statistics
-    total_visits = hospital.patient_visits.count()
-    total_staff = hospital.staff.filter(is_active=True).count()
-    total_claims = hospital.claims.count()
-    total_claims_amount = hospital.claims.aggregate(
-        total=Sum('amount_claimed')
-    )['total'] or Decimal('0.00')
+    # Claim statistics are correlated subqueries so they arrive with the
+    # hospital row without grouping by every selected column.
+    hospital = get_object_or_404(
+        Hospital.objects.select_related('county', 'subcounty', 'approved_by').annotate(
+            _total_claims=Coalesce(
+                related_aggregate(Claim, 'hospital', Count('pk')), 0,
+                output_field=IntegerField()
+            ),
+            _total_claims_amount=Coalesce(
+                related_aggregate(Claim, 'hospital', Sum('amount_claimed')), Decimal('0.00'),
+                output_field=DecimalField(max_digits=12, decimal_places=2)
+            ),
+        ).prefetch_related(
+            # Sliced prefetches: each relation's latest rows in one query
+            Prefetch(
+                'staff',
+                queryset=HospitalStaff.objects.select_related('user').order_by('id')[:10],
+                to_attr='staff_recent'
+            ),
+            Prefetch(
+                'patient_visits',
+                queryset=HospitalVisit.objects.select_related('member').prefetch_related(
+                    visit_staff_prefetch()
+                ).defer(
+                    *VISIT_DEFERRED_FIELDS,
+                    *(f'member__{name}' for name in MEMBER_DEFERRED_FIELDS)
+                ).order_by('-visit_date')[:10],
+                to_attr='visits_recent'
+            ),
+            Prefetch(
+                'claims',
+                queryset=Claim.objects.select_related('visit__member').defer(
+                    *CLAIM_LIST_DEFERRED_FIELDS
+                ).order_by('-submitted_date')[:10],
+                to_attr='claims_recent'
+            ),
+            Prefetch(
+                'pharmacy_stock',
+                queryset=PharmacyStock.objects.select_related('medicine').order_by('-updated_at')[:10],
+                to_attr='stock_recent'
+            ),
+        ),
+        id=hospital_id
+    )
     
     context = {
         'hospital': hospital,
-        'staff': staff,
-        'recent_visits': recent_visits,
-        'claims': claims,
-        'pharmacy_stock': pharmacy_stock,
-        'total_visits': total_visits,
-        'total_staff': total_staff,
-        'total_claims': total_claims,
-        'total_claims_amount': total_claims_amount,
+        'staff': hospital.staff_recent,
+        'recent_visits': hospital.visits_recent,
+        'claims': hospital.claims_recent,
+        'pharmacy_stock': hospital.stock_recent,
+        'total_visits': hospital.visit_count,
+        'total_staff': hospital.active_staff_count,
+        'total_claims': hospital._total_claims,
+        'total_claims_amount': hospital._total_claims_amount,
     }
     
     return render(request, 'admin/hospitals/detail.html', context)
@@ -423,14 +584,14 @@ def hospital_detail(request, hospital_id):
 # CLAIMS MANAGEMENT VIEWS
 # ============================================================================
 
-@login_required
+@admin_required
 def claims_list(request):
     """List all claims with filtering"""
-    if request.user.user_type != 'admin':
-        messages.error(request, 'Access denied.')
-        return redirect('admin_login')
-    
-    claims = Claim.objects.select_related('hospital', 'visit__member').all()
+    claims = Claim.objects.select_related(
+        'hospital__county', 'visit__member__county', 'reviewed_by'
+    ).only(
+        *CLAIM_LIST_FIELDS
+    )
     
     # Filtering
     status_filter = request.GET.get('status')
@@ -447,9 +608,11 @@ def claims_list(request):
         claims = claims.filter(claim_type=claim_type_filter)
     
     # Pagination
-    paginator = Paginator(claims.order_by('-submitted_date'), 25)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    paginator = CursorPaginator(
+        claims, ('-submitted_date', '-id'), 25,
+        with_count=True, count_cache_key=list_count_cache_key(request, 'claims')
+    )
+    page_obj = paginator.page(request.GET.get('cursor'))
     
     # Get filter options
     hospitals = Hospital.objects.filter(status='active')
@@ -468,69 +631,98 @@ def claims_list(request):
     
     return render(request, 'admin/claims/list.html', context)
 
-@login_required
+@admin_required
 def claim_detail(request, claim_id):
     """View and process a specific claim"""
-    if request.user.user_type != 'admin':
-        messages.error(request, 'Access denied.')
-        return redirect('admin_login')
-    
-    claim = get_object_or_404(Claim, id=claim_id)
+    claim = get_object_or_404(
+        Claim.objects.select_related(
+            'hospital__county', 'visit__member__county', 'visit__hospital',
+            'visit__attending_staff__user', 'reviewed_by'
+        ).prefetch_related(
+            Prefetch(
+                'visit__prescriptions',
+                queryset=Prescription.objects.prefetch_related('items__medicine')
+            )
+        ),
+        id=claim_id
+    )
     
     if request.method == 'POST':
         action = request.POST.get('action')
         
         if action == 'approve':
-            approved_amount = request.POST.get('approved_amount')
             review_notes = request.POST.get('review_notes', '')
             
             try:
-                approved_amount = Decimal(approved_amount)
-                claim.status = 'approved'
-                claim.amount_approved = approved_amount
-                claim.review_notes = review_notes
-                claim.reviewed_date = timezone.now()
-                claim.reviewed_by = request.user
-                claim.save()
-                
-                # Log the approval
-                AuditLog.objects.create(
-                    user=request.user,
-                    action_type='approval',
-                    model_name='Claim',
-                    object_id=str(claim.id),
-                    description=f'Claim {claim.claim_number} approved for KSh {approved_amount}',
-                    ip_address=request.META.get('REMOTE_ADDR')
-                )
-                
-                messages.success(request, f'Claim approved for KSh {approved_amount}')
-                
-            except (ValueError, TypeError):
+                approved_amount = Decimal(request.POST.get('approved_amount'))
+            except (InvalidOperation, ValueError, TypeError):
                 messages.error(request, 'Invalid approved amount.')
+            else:
+                with transaction.atomic():
+                    # Conditional UPDATE so two admins cannot both review the same claim
+                    approved = Claim.objects.filter(id=claim.id, status='submitted').update(
+                        status='approved',
+                        amount_approved=approved_amount,
+                        review_notes=review_notes,
+                        reviewed_date=timezone.now(),
+                        reviewed_by=request.user
+                    )
+                    
+                    if approved:
+                        # Log the approval
+                        queue_audit_log(
+                            user=request.user,
+                            action_type='approval',
+                            model_name='Claim',
+                            object_id=str(claim.id),
+                            description=f'Claim {claim.claim_number} approved for KSh {approved_amount}',
+                            ip_address=request.META.get('REMOTE_ADDR')
+                        )
+                        
+                        # update() skips post_save, so invalidate the dashboard cache here
+                        transaction.on_commit(lambda: bump_cache_version(DASHBOARD_CACHE_VERSION))
+                
+                if approved:
+                    messages.success(request, f'Claim approved for KSh {approved_amount}')
+                else:
+                    messages.warning(request, 'Claim is not in submitted status.')
         
         elif action == 'reject':
             rejection_reason = request.POST.get('rejection_reason', '')
             
             if rejection_reason:
-                claim.status = 'rejected'
-                claim.rejection_reason = rejection_reason
-                claim.reviewed_date = timezone.now()
-                claim.reviewed_by = request.user
-                claim.save()
-                
-                # Log the rejection
-                AuditLog.objects.create(
-                    user=request.user,
-                    action_type='rejection',
-                    model_name='Claim',
-                    object_id=str(claim.id),
-                    description=f'Claim {claim.claim_number} rejected: {rejection_reason}',
-                    ip_address=request.META.get('REMOTE_ADDR')
-                )
+                with transaction.atomic():
+                    rejected = Claim.objects.filter(id=claim.id, status='submitted').update(
+                        status='rejected',
+                        rejection_reason=rejection_reason,
+                        reviewed_date=timezone.now(),
+                        reviewed_by=request.user
+                    )
+                    
+                    if rejected:
+                        # Log the rejection
+                        queue_audit_log(
+                            user=request.user,
+                            action_type='rejection',
+                            model_name='Claim',
+                            object_id=str(claim.id),
+                            description=f'Claim {claim.claim_number} rejected: {rejection_reason}',
+                            ip_address=request.META.get('REMOTE_ADDR')
+                        )
+                        
+                        transaction.on_commit(lambda: bump_cache_version(DASHBOARD_CACHE_VERSION))
                 
-                messages.success(request, 'Claim rejected successfully.')
+                if rejected:
+                    messages.success(request, 'Claim rejected successfully.')
+                else:
+                    messages.warning(request, 'Claim is not in submitted status.')
             else:
                 messages.error(request, 'Rejection reason is required.')
+        
+        claim.refresh_from_db(fields=[
+            'status', 'amount_approved', 'review_notes', 'rejection_reason',
+            'reviewed_date', 'reviewed_by'
+        ])
     
     context = {
         'claim': claim,
@@ -542,43 +734,49 @@ def claim_detail(request, claim_id):
 # REPORTS AND ANALYTICS VIEWS
 # ============================================================================
 
-@login_required
+@admin_required
+@cache_control(private=True, no_cache=True)
 def reports_dashboard(request):
     """Reports and analytics dashboard"""
-    if request.user.user_type != 'admin':
-        messages.error(request, 'Access denied.')
-        return redirect('admin_login')
-    
     return render(request, 'admin/reports/dashboard.html')
 
-@login_required
+@admin_required
 def financial_reports(request):
     """Financial reports and analytics"""
-    if request.user.user_type != 'admin':
-        messages.error(request, 'Access denied.')
-        return redirect('admin_login')
-    
     # Get date range from request
     start_date = request.GET.get('start_date')
     end_date = request.GET.get('end_date')
     
     if not start_date:
-        start_date = timezone.now().date().replace(month=1, day=1)  # Start of year
+        start_date = timezone.localdate().replace(month=1, day=1)  # Start of year
     else:
         start_date = datetime.strptime(start_date, '%Y-%m-%d').date()
     
     if not end_date:
-        end_date = timezone.now().date()
+        end_date = timezone.localdate()
     else:
         end_date = datetime.strptime(end_date, '%Y-%m-%d').date()
     
+    # Half-open datetime range so the payment_date/submitted_date indexes apply
+    range_start = start_of_day(start_date)
+    range_end = start_of_day(end_date + timedelta(days=1))
+    
     # Contributions analysis
     contributions_data = Contribution.objects.filter(
         status='completed',
-        payment_date__date__gte=start_date,
-        payment_date__date__lte=end_date
+        payment_date__gte=range_start,
+        payment_date__lt=range_end
     )
     
+    if request.GET.get('export') == 'csv':
+        response = StreamingHttpResponse(
+            _contribution_csv_rows(contributions_data), content_type='text/csv'
+        )
+        response['Content-Disposition'] = (
+            f'attachment; filename="contributions_{start_date}_{end_date}.csv"'
+        )
+        return response
+    
     total_contributions = contributions_data.aggregate(total=Sum('amount'))['total'] or Decimal('0.00')
     contribution_count = contributions_data.count()
     avg_contribution = total_contributions / contribution_count if contribution_count > 0 else Decimal('0.00')
@@ -591,8 +789,8 @@ def financial_reports(request):
     
     # Claims analysis
     claims_data = Claim.objects.filter(
-        submitted_date__date__gte=start_date,
-        submitted_date__date__lte=end_date
+        submitted_date__gte=range_start,
+        submitted_date__lt=range_end
     )
     
     total_claims_amount = claims_data.aggregate(total=Sum('amount_claimed'))['total'] or Decimal('0.00')
@@ -620,27 +818,31 @@ def financial_reports(request):
     
     return render(request, 'admin/reports/financial.html', context)
 
+def _contribution_csv_rows(contributions):
+    # Rows are streamed from a server-side cursor in chunks, so memory stays
+    # flat however large the date range is.
+    writer = csv.writer(Echo())
+    yield writer.writerow(name.rsplit('__', 1)[-1] for name in CONTRIBUTION_EXPORT_FIELDS)
+    rows = contributions.order_by('payment_date', 'id').values_list(
+        *CONTRIBUTION_EXPORT_FIELDS
+    ).iterator(chunk_size=2000)
+    for payment_date, *rest in rows:
+        yield writer.writerow([timezone.localtime(payment_date).strftime('%Y-%m-%d %H:%M:%S'), *rest])
+
 # ============================================================================
 # SYSTEM MANAGEMENT VIEWS
 # ============================================================================
 
-@login_required
+@admin_required
+@cache_control(private=True, no_cache=True)
 def system_settings(request):
     """System settings and configuration"""
-    if request.user.user_type != 'admin':
-        messages.error(request, 'Access denied.')
-        return redirect('admin_login')
-    
     return render(request, 'admin/system/settings.html')
 
-@login_required
+@admin_required
 def audit_logs(request):
     """View system audit logs"""
-    if request.user.user_type != 'admin':
-        messages.error(request, 'Access denied.')
-        return redirect('admin_login')
-    
-    logs = AuditLog.objects.select_related('user').all()
+    logs = AuditLog.objects.select_related('user').only(*AUDIT_LOG_LIST_FIELDS)
     
     # Filtering
     action_filter = request.GET.get('action')
@@ -657,14 +859,16 @@ def audit_logs(request):
         logs = logs.filter(model_name=model_filter)
     
     # Pagination
-    paginator = Paginator(logs, 50)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    paginator = CursorPaginator(
+        logs, ('-timestamp', '-id'), 50,
+        with_count=True, count_cache_key=list_count_cache_key(request, 'audit_logs')
+    )
+    page_obj = paginator.page(request.GET.get('cursor'))
     
     # Get filter options
     action_choices = AuditLog.ACTION_TYPES
     users = User.objects.filter(user_type='admin')
-    models = AuditLog.objects.values_list('model_name', flat=True).distinct()
+    models = get_audit_model_names()
     
     context = {
         'page_obj': page_obj,
@@ -682,25 +886,32 @@ def audit_logs(request):
 # API VIEWS FOR AJAX REQUESTS
 # ============================================================================
 
-@login_required
+def _dashboard_stats_body(request):
+    # Read once per request: shared by the ETag check and the response body
+    if not hasattr(request, '_dashboard_stats_body'):
+        today = timezone.localdate()
+        # The serialized body is cached so hits skip JSON encoding as well
+        request._dashboard_stats_body = get_stale_while_revalidate(
+            dashboard_stats_key(today),
+            lambda: dashboard_stats_payload(today),
+            fresh_for=DASHBOARD_STATS_FRESH_FOR,
+            timeout=DASHBOARD_STATS_TIMEOUT,
+        )
+    return request._dashboard_stats_body
+
+def _dashboard_stats_etag(request):
+    # Hash of the body itself, so background refreshes and writes that skip
+    # the cache version bump still change the ETag
+    if request.user.user_type != 'admin':
+        return None
+    return hashlib.md5(_dashboard_stats_body(request), usedforsecurity=False).hexdigest()
+
+@login_required(login_url='admin_login')
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=_dashboard_stats_etag)
 def dashboard_stats_api(request):
     """API endpoint for dashboard statistics (for real-time updates)"""
     if request.user.user_type != 'admin':
         return JsonResponse({'error': 'Access denied'}, status=403)
     
-    today = timezone.now().date()
-    
-    stats = {
-        'total_members': SHAMember.objects.count(),
-        'pending_members': SHAMember.objects.filter(status='pending').count(),
-        'total_hospitals': Hospital.objects.count(),
-        'pending_claims': Claim.objects.filter(status='submitted').count(),
-        'today_visits': HospitalVisit.objects.filter(visit_date__date=today).count(),
-        'low_stock_alerts': PharmacyStock.objects.filter(
-            current_stock__lte=models.F('minimum_stock_level')
-        ).count(),
-    }
-    
-    return JsonResponse(stats)
-
-from django.db import models  # Add this import at the top
\ No newline at end of file
+    return HttpResponse(_dashboard_stats_body(request), content_type='application/json')